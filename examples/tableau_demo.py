@@ -101,10 +101,10 @@ class TableauDemo:
         
         for formula_str, description, expected in test_cases:
             formula = parse_formula(formula_str)
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             tableau = classical_signed_tableau(T(formula))
             result = tableau.build()
-            end_time = time.time()
+            end_ns = time.perf_counter_ns()
             
             # Count statistics
             branch_count = len(tableau.branches)
@@ -116,7 +116,7 @@ class TableauDemo:
                 name=description,
                 satisfiable=result,
                 models=[str(model) for model in models],
-                construction_time=end_time - start_time,
+                construction_time=(end_ns - start_ns) / 1e9,
                 rule_applications=rule_applications,
                 branch_count=branch_count,
                 logic_system="classical"
@@ -124,7 +124,7 @@ class TableauDemo:
             self.results.append(demo_result)
             
             status = "✅" if result == expected else "❌"
-            print(f"{status} {description}: '{formula_str}' -> {'SAT' if result else 'UNSAT'} ({end_time - start_time:.4f}s)")
+            print(f"{status} {description}: '{formula_str}' -> {'SAT' if result else 'UNSAT'} ({(end_ns - start_ns) / 1e9:.4f}s)")
             
         print()
         
@@ -147,26 +147,26 @@ class TableauDemo:
         print("Valid theorems (negation should be UNSAT):")
         for formula_str, description in theorems:
             formula = parse_formula(formula_str)
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             # To check if something is a theorem, we test if its negation is unsatisfiable
             negated_formula = Negation(formula)
             negated_tableau = classical_signed_tableau(T(negated_formula))
             is_theorem = not negated_tableau.build()
-            end_time = time.time()
+            end_ns = time.perf_counter_ns()
             
             status = "✅" if is_theorem else "❌"
-            print(f"  {status} {description}: '{formula_str}' -> {'THEOREM' if is_theorem else 'NOT THEOREM'} ({end_time - start_time:.4f}s)")
+            print(f"  {status} {description}: '{formula_str}' -> {'THEOREM' if is_theorem else 'NOT THEOREM'} ({(end_ns - start_ns) / 1e9:.4f}s)")
             
         print("\nNon-theorems (should be satisfiable):")
         for formula_str, description in non_theorems:
             formula = parse_formula(formula_str)
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             tableau = classical_signed_tableau(T(formula))
             is_satisfiable = tableau.build()
-            end_time = time.time()
+            end_ns = time.perf_counter_ns()
             
             status = "✅" if is_satisfiable else "❌"
-            print(f"  {status} {description}: '{formula_str}' -> {'SAT' if is_satisfiable else 'UNSAT'} ({end_time - start_time:.4f}s)")
+            print(f"  {status} {description}: '{formula_str}' -> {'SAT' if is_satisfiable else 'UNSAT'} ({(end_ns - start_ns) / 1e9:.4f}s)")
             
         print()
         
@@ -185,11 +185,11 @@ class TableauDemo:
         
         for formula_str, description in test_cases:
             formula = parse_formula(formula_str)
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             tableau = classical_signed_tableau(T(formula))
             is_satisfiable = tableau.build()
             models = tableau.extract_all_models() if is_satisfiable else []
-            end_time = time.time()
+            end_ns = time.perf_counter_ns()
             
             print(f"📊 {description}: '{formula_str}'")
             if is_satisfiable:
@@ -200,7 +200,7 @@ class TableauDemo:
                     print(f"   ... and {len(models) - 3} more models")
             else:
                 print("   Result: UNSATISFIABLE")
-            print(f"   Time: {end_time - start_time:.4f}s")
+            print(f"   Time: {(end_ns - start_ns) / 1e9:.4f}s")
             print()
             
     def _demo_three_valued_logic(self):
@@ -267,9 +267,9 @@ class TableauDemo:
         print()
         
         # Build the tableau step by step
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         is_satisfiable = tableau.build()
-        end_time = time.time()
+        end_ns = time.perf_counter_ns()
         
         # Show construction steps if available
         if hasattr(tableau, 'construction_steps') and tableau.construction_steps:
@@ -280,7 +280,7 @@ class TableauDemo:
         
         # Show the final result
         print(f"Final Result: {'SATISFIABLE' if is_satisfiable else 'UNSATISFIABLE'}")
-        print(f"Construction time: {end_time - start_time:.4f}s")
+        print(f"Construction time: {(end_ns - start_ns) / 1e9:.4f}s")
         print(f"Total branches: {len(tableau.branches)}")
         print(f"Open branches: {len([b for b in tableau.branches if not b.is_closed])}")
         print(f"Closed branches: {len([b for b in tableau.branches if b.is_closed])}")
@@ -351,18 +351,20 @@ class TableauDemo:
             formula = parse_formula(formula_str)
             
             # Classical performance
-            start = time.time()
+            start_ns = time.perf_counter_ns()
             classical_tableau = classical_signed_tableau(T(formula))
             classical_result = classical_tableau.build()
-            classical_time = time.time() - start
+            classical_time = (time.perf_counter_ns() - start_ns) / 1e9
             
-            # WK3 performance
-            start = time.time()
-            t3_tableau = three_valued_signed_tableau(T3(formula))
-            u_tableau = three_valued_signed_tableau(U(formula))
-            t3_result = t3_tableau.build()
-            u_result = u_tableau.build()
-            wk3_time = time.time() - start
+            # WK3 performance: satisfiable if it can be true OR undefined,
+            # so the U tableau is only needed when the T3 tableau closes,
+            # and then reuses its engine
+            start_ns = time.perf_counter_ns()
+            wk3_tableau = three_valued_signed_tableau(T3(formula))
+            if not wk3_tableau.build():
+                wk3_tableau.reset([U(formula)])
+            wk3_result = wk3_tableau.build()
+            wk3_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             ratio = wk3_time / classical_time if classical_time > 0 else float('inf')
             
@@ -387,14 +389,14 @@ class TableauDemo:
             print(f"🎲 {description}")
             print(f"   Formula: {formula_str}")
             
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             tableau = classical_signed_tableau(T(formula))
             is_satisfiable = tableau.build()
-            end_time = time.time()
+            end_ns = time.perf_counter_ns()
             
             print(f"   Result: {'SATISFIABLE' if is_satisfiable else 'UNSATISFIABLE'}")
             print(f"   Branches: {len(tableau.branches)}")
-            print(f"   Time: {end_time - start_time:.4f}s")
+            print(f"   Time: {(end_ns - start_ns) / 1e9:.4f}s")
             
             if is_satisfiable:
                 models = tableau.extract_all_models()
@@ -24,7 +24,7 @@ def test_satisfiability_examples():
     print(f"Satisfiable: {result}")
     if result:
         models = tableau.extract_all_models()
-        print(f"Model: {models[0].assignments}")
+        print(f"Model: {dict(models[0].assignments)}")
     print()
     
     # Example 2: Conjunction - satisfiable if both parts can be true
@@ -38,7 +38,7 @@ def test_satisfiability_examples():
     print(f"Satisfiable: {result}")
     if result:
         models = tableau.extract_all_models()
-        print(f"Model: {models[0].assignments}")
+        print(f"Model: {dict(models[0].assignments)}")
     print()
     
     # Example 3: Contradiction - never satisfiable
@@ -86,7 +86,7 @@ def test_implication_examples():
         models = tableau.extract_all_models()
         print(f"Found {len(models)} models:")
         for i, model in enumerate(models):
-            print(f"  Model {i+1}: {model.assignments}")
+            print(f"  Model {i+1}: {dict(model.assignments)}")
     print()
     
     # Example 2: Modus ponens test
@@ -63,7 +63,7 @@ def visualize_branching_tableau():
         models = tableau.extract_all_models()
         print(f"\nFound {len(models)} satisfying models:")
         for i, model in enumerate(models):
-            print(f"Model {i+1}: {model.assignments}")
+            print(f"Model {i+1}: {dict(model.assignments)}")
 
 def visualize_contradiction():
     """Show how contradictions are detected."""
@@ -4,6 +4,61 @@
 from tableaux import Atom, Conjunction, Disjunction, Implication, Negation
 from tableaux import T, F, T3, U, classical_signed_tableau, three_valued_signed_tableau
 
+def truth_table_mask(formula, atoms):
+    """
+    Evaluate a classical formula on all 2^n assignments at once.
+    
+    Row i of the truth table makes atom k true iff bit k of i is set. Each
+    atom's column is packed into one Python int (bit i = its value in row i),
+    so every connective is a single bitwise operation over all rows.
+    
+    Returns:
+        (mask, full, columns): bit i of mask is set iff row i satisfies
+        formula, full has all rows set, columns maps atom -> column mask
+    """
+    rows = 1 << len(atoms)
+    full = (1 << rows) - 1
+    
+    columns = {}
+    for k, atom in enumerate(atoms):
+        period = 2 << k
+        # 2^k zeros then 2^k ones, repeated across all rows
+        block = ((1 << (1 << k)) - 1) << (1 << k)
+        columns[atom] = block * (full // ((1 << period) - 1))
+    
+    def evaluate(node):
+        if isinstance(node, Atom):
+            return columns[node.name]
+        if isinstance(node, Negation):
+            return full ^ evaluate(node.operand)
+        if isinstance(node, Conjunction):
+            return evaluate(node.left) & evaluate(node.right)
+        if isinstance(node, Disjunction):
+            return evaluate(node.left) | evaluate(node.right)
+        if isinstance(node, Implication):
+            return (full ^ evaluate(node.antecedent)) | evaluate(node.consequent)
+        raise ValueError(f"Unsupported formula: {node}")
+    
+    return evaluate(formula), full, columns
+
+def verify_models_bitmask(formula, models):
+    """
+    Cross-check tableau models against the formula's full truth table.
+    
+    A tableau model fixes only the atoms on its branch; it is correct iff
+    every truth-table row agreeing with it satisfies the formula.
+    """
+    atoms = sorted(formula.get_atoms())
+    satisfying, full, columns = truth_table_mask(formula, atoms)
+    
+    results = []
+    for model in models:
+        rows = full
+        for atom, value in model.assignments.items():
+            rows &= columns[atom] if value else full ^ columns[atom]
+        results.append(rows & ~satisfying == 0)
+    return satisfying.bit_count(), len(atoms), results
+
 def analyze_classical_models():
     """Extract and analyze classical logic models."""
     
@@ -33,13 +88,19 @@ def analyze_classical_models():
         print(f"Found {len(models)} models:")
         
         for i, model in enumerate(models):
-            print(f"\nModel {i+1}: {model.assignments}")
+            print(f"\nModel {i+1}: {dict(model.assignments)}")
             
             # Verify model satisfies formula
             satisfies = model.satisfies(formula)
             print(f"  Satisfies formula: {satisfies}")
         print()
     
+        # Cross-check all models against the complete truth table at once
+        satisfying_rows, n_atoms, verified = verify_models_bitmask(formula, models)
+        print(f"Truth table: {satisfying_rows} of {2 ** n_atoms} assignments satisfy the formula")
+        print(f"Every completion of every tableau model satisfies it: {all(verified)}")
+        print()
+    
     # Analyze each clause
     print("Clause analysis:")
     for i, model in enumerate(models):
@@ -91,20 +152,16 @@ def analyze_wk3_models():
     # Show which assignments DON'T satisfy
     print("Non-satisfying assignments (formula evaluates to 'f'):")
     from tableaux import t, f, e
-    all_assignments = [
-        (t, t), (t, f), (t, e),
-        (f, t), (f, f), (f, e),
-        (e, t), (e, f), (e, e)
-    ]
-    
-    from tableaux import WK3Model
-    from tableaux import weakKleeneOperators
-    
-    for p_val, q_val in all_assignments:
-        model = WK3Model({"p": p_val, "q": q_val})
-        result = model.satisfies(formula)
-        
-        if result == f:
+    from tableaux import weakKleeneModel
+    all_assignments = [(p_val, q_val) for p_val in (t, f, e) for q_val in (t, f, e)]
+    
+    # Evaluate the whole truth table with one compiled evaluator
+    truth_table = weakKleeneModel.batch_satisfies(
+        [weakKleeneModel({"p": p_val, "q": q_val}) for p_val, q_val in all_assignments],
+        formula)
+    
+    for (p_val, q_val), result in zip(all_assignments, truth_table):
+        if result is f:
             print(f"  p={p_val}, q={q_val} → {result}")
 
 def model_comparison():
@@ -35,7 +35,7 @@ def first_order_basics():
     print(f"Satisfiable: {result}")
     if result:
         models = tableau.extract_all_models()
-        print(f"Model: {models[0].assignments}")
+        print(f"Model: {dict(models[0].assignments)}")
     print()
 
 def predicate_logic_reasoning():
@@ -69,7 +69,7 @@ def predicate_logic_reasoning():
         models = tableau.extract_all_models()
         print(f"Found {len(models)} models")
         for model in models:
-            print(f"  {model.assignments}")
+            print(f"  {dict(model.assignments)}")
     print()
     
     # Example 2: Multiple individuals
@@ -83,7 +83,7 @@ def predicate_logic_reasoning():
     if result:
         models = tableau.extract_all_models()
         for model in models:
-            print(f"  {model.assignments}")
+            print(f"  {dict(model.assignments)}")
     print()
 
 def test_logical_validity():
@@ -116,7 +116,7 @@ def test_logical_validity():
         models = tableau.extract_all_models()
         print("Countermodel where implication fails:")
         for model in models:
-            print(f"  {model.assignments}")
+            print(f"  {dict(model.assignments)}")
     else:
         print("Original implication is VALID (tautology)")
     print()
@@ -9,33 +9,54 @@ Key differences between weak and strong Kleene logic:
 
 from tableaux import TruthValue, t, f, e, weakKleeneOperators
 
-def print_truth_table(name, func, is_unary=False):
-    """Print a truth table for a function"""
+VALUES = (t, f, e)
+
+def truth_table(func, is_unary=False):
+    """Compute a function's full truth table, keyed by argument tuple"""
+    if is_unary:
+        return {(a,): func(a) for a in VALUES}
+    return {(a, b): func(a, b) for a in VALUES for b in VALUES}
+
+def undefined_propagates(table):
+    """
+    Check the defining weak Kleene property on a whole truth table.
+    
+    Every row with an 'e' argument must yield 'e'. This is the pure core
+    of the verification, kept free of printing so it can be reused on any
+    table (or batch of tables) without the report.
+    """
+    return all(result is e for args, result in table.items() if e in args)
+
+def print_truth_table(name, func, table):
+    """Print a truth table computed by truth_table()"""
     print(f"\n{name} Truth Table:")
     print("=" * 30)
     
-    if is_unary:
-        # Unary operation (negation)
-        for a in [t, f, e]:
-            result = func(a)
-            print(f"  {func.__name__}({a}) = {result}")
-    else:
-        # Binary operation
-        for a in [t, f, e]:
-            for b in [t, f, e]:
-                result = func(a, b)
-                print(f"  {a} {name.lower()} {b} = {result}")
+    for args, result in table.items():
+        if len(args) == 1:
+            # Unary operation (negation)
+            print(f"  {func.__name__}({args[0]}) = {result}")
+        else:
+            # Binary operation
+            print(f"  {args[0]} {name.lower()} {args[1]} = {result}")
 
 def verify_weak_kleene():
     """Verify the implementation matches weak Kleene semantics"""
     print("VERIFYING WEAK KLEENE LOGIC IMPLEMENTATION")
     print("=" * 50)
     
+    # Compute every truth table once; the checks below look results up
+    # instead of calling the operators again
+    negation = truth_table(weakKleeneOperators.negation, is_unary=True)
+    conjunction = truth_table(weakKleeneOperators.conjunction)
+    disjunction = truth_table(weakKleeneOperators.disjunction)
+    implication = truth_table(weakKleeneOperators.implication)
+    
     # Print all truth tables
-    print_truth_table("NEGATION", weakKleeneOperators.negation, is_unary=True)
-    print_truth_table("CONJUNCTION", weakKleeneOperators.conjunction)
-    print_truth_table("DISJUNCTION", weakKleeneOperators.disjunction)
-    print_truth_table("IMPLICATION", weakKleeneOperators.implication)
+    print_truth_table("NEGATION", weakKleeneOperators.negation, negation)
+    print_truth_table("CONJUNCTION", weakKleeneOperators.conjunction, conjunction)
+    print_truth_table("DISJUNCTION", weakKleeneOperators.disjunction, disjunction)
+    print_truth_table("IMPLICATION", weakKleeneOperators.implication, implication)
     
     print("\n" + "=" * 50)
     print("WEAK vs STRONG KLEENE COMPARISON")
@@ -44,21 +65,21 @@ def verify_weak_kleene():
     # Key test cases that distinguish weak from strong Kleene
     test_cases = [
         # Conjunction cases where strong Kleene differs
-        ("f ∧ e", f, e, weakKleeneOperators.conjunction),
-        ("e ∧ f", e, f, weakKleeneOperators.conjunction),
+        ("f ∧ e", f, e, conjunction),
+        ("e ∧ f", e, f, conjunction),
         
         # Disjunction cases where strong Kleene differs  
-        ("t ∨ e", t, e, weakKleeneOperators.disjunction),
-        ("e ∨ t", e, t, weakKleeneOperators.disjunction),
+        ("t ∨ e", t, e, disjunction),
+        ("e ∨ t", e, t, disjunction),
         
         # Implication cases
-        ("f → e", f, e, weakKleeneOperators.implication),
-        ("e → t", e, t, weakKleeneOperators.implication),
+        ("f → e", f, e, implication),
+        ("e → t", e, t, implication),
     ]
     
     print("\nKey distinguishing cases:")
-    for description, a, b, func in test_cases:
-        result = func(a, b)
+    for description, a, b, table in test_cases:
+        result = table[a, b]
         print(f"  {description} = {result}")
     
     # Verify weak Kleene properties
@@ -68,19 +89,21 @@ def verify_weak_kleene():
     
     # In weak Kleene, these should ALL return 'e'
     weak_kleene_tests = [
-        ("t ∧ e", weakKleeneOperators.conjunction(t, e)),
-        ("e ∧ t", weakKleeneOperators.conjunction(e, t)),
-        ("e ∧ e", weakKleeneOperators.conjunction(e, e)),
-        ("f ∨ e", weakKleeneOperators.disjunction(f, e)),
-        ("e ∨ f", weakKleeneOperators.disjunction(e, f)),
-        ("e ∨ e", weakKleeneOperators.disjunction(e, e)),
-        ("t → e", weakKleeneOperators.implication(t, e)),
-        ("e → f", weakKleeneOperators.implication(e, f)),
-        ("e → e", weakKleeneOperators.implication(e, e)),
-        ("¬e", weakKleeneOperators.negation(e)),
+        ("t ∧ e", conjunction[t, e]),
+        ("e ∧ t", conjunction[e, t]),
+        ("e ∧ e", conjunction[e, e]),
+        ("f ∨ e", disjunction[f, e]),
+        ("e ∨ f", disjunction[e, f]),
+        ("e ∨ e", disjunction[e, e]),
+        ("t → e", implication[t, e]),
+        ("e → f", implication[e, f]),
+        ("e → e", implication[e, e]),
+        ("¬e", negation[e,]),
     ]
     
-    all_weak_kleene = True
+    # The listed cases are printed; the verdict also covers every row
+    all_weak_kleene = all(undefined_propagates(table)
+                          for table in (negation, conjunction, disjunction, implication))
     
     for test_name, result in weak_kleene_tests:
         expected = e  # In weak Kleene, all these should be 'e'
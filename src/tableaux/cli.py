@@ -10,8 +10,12 @@ import sys
 import argparse
 import json
 import csv
+import re
 import time
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple
 from io import StringIO
 
 # Import tableau components - using only tableau approach
@@ -26,6 +30,8 @@ from .unified_model import UnifiedModel, ClassicalModel, weakKleeneModel, WkrqMo
 class EnhancedFormulaParser:
     """Enhanced parser supporting the syntax described in CLI_GUIDE.md"""
     
+    _TOKEN_PATTERN = re.compile(r'(\w+|->|<->|[()&|~])')
+    
     def __init__(self):
         self.tokens = []
         self.pos = 0
@@ -62,9 +68,7 @@ class EnhancedFormulaParser:
         formula_str = formula_str.replace('↔', '<->')
         
         # Tokenize using regex
-        import re
-        pattern = r'(\w+|->|<->|[()&|~])'
-        tokens = re.findall(pattern, formula_str)
+        tokens = self._TOKEN_PATTERN.findall(formula_str)
         
         # Filter out empty tokens
         return [token for token in tokens if token.strip()]
@@ -207,6 +211,43 @@ class OutputFormatter:
         return "\n".join(lines)
 
 
+def _solve_formula(formula_str: str, logic_system: str, want_models: bool,
+                   max_models: int) -> Tuple[Dict[str, Any], int]:
+    """
+    Parse and decide a single formula for file processing.
+    
+    Module-level so it can run in a worker process.
+    
+    Returns:
+        Tuple of (result data, total number of models found)
+    """
+    try:
+        formula = EnhancedFormulaParser().parse(formula_str)
+        tableau, is_satisfiable = EnhancedTableauCLI._build_tableau(formula, logic_system)
+        
+        # Keep only the models that are reported; the rest are just counted
+        models, model_count = [], 0
+        if is_satisfiable and want_models:
+            model_iter = tableau.iter_models()
+            models = list(islice(model_iter, max_models))
+            model_count = len(models) + sum(1 for _ in model_iter)
+        
+        result = {
+            "formula": str(formula),
+            "logic": logic_system,
+            "satisfiable": is_satisfiable,
+            "models": models
+        }
+        return result, model_count
+    
+    except Exception as e:
+        return {
+            "formula": formula_str,
+            "logic": logic_system,
+            "error": str(e)
+        }, 0
+
+
 class EnhancedTableauCLI:
     """Enhanced CLI with full argument parsing and features"""
     
@@ -228,6 +269,7 @@ Examples:
   %(prog)s --stats "complex_formula"   # Show statistics
   %(prog)s --format=json "p"           # JSON output
   %(prog)s --file=formulas.txt         # Process file
+  %(prog)s --file=formulas.txt --jobs=4  # Process file with 4 workers
   %(prog)s                             # Interactive mode
             """
         )
@@ -280,6 +322,12 @@ Examples:
             action='store_true', 
             help='Process multiple formulas from command line or stdin'
         )
+        self.arg_parser.add_argument(
+            '--jobs', 
+            type=int, 
+            default=1,
+            help='Worker processes for --file (default: 1)'
+        )
         
         # Advanced options
         self.arg_parser.add_argument(
@@ -327,10 +375,31 @@ Examples:
         else:
             self._interactive_mode(logic_system)
     
+    @staticmethod
+    def _build_tableau(formula: Formula, logic_system: str):
+        """
+        Build the tableau that decides a formula in the given logic.
+        
+        For weak Kleene a formula is satisfiable if it can be true OR
+        undefined. The T3 tableau is reported whenever it is open, so the
+        U tableau is only built when the T3 tableau closes, reusing the
+        same engine.
+        
+        Returns:
+            Tuple of (tableau, is_satisfiable)
+        """
+        if logic_system == "wk3":
+            tableau = three_valued_signed_tableau(T3(formula))
+            if not tableau.build():
+                tableau.reset([U(formula)])
+        else:
+            tableau = classical_signed_tableau(T(formula))
+        return tableau, tableau.build()
+    
     def _process_single_formula(self, formula_str: str, logic_system: str, args):
         """Process a single formula"""
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             # Parse formula
             formula = self.parser.parse(formula_str)
@@ -345,38 +414,26 @@ Examples:
                 return
             
             # Create tableau using actual API
-            if logic_system == "wk3":
-                # For weak Kleene, check if formula can be true OR undefined
-                t3_tableau = three_valued_signed_tableau(T3(formula))
-                u_tableau = three_valued_signed_tableau(U(formula))
-                t3_satisfiable = t3_tableau.build()
-                u_satisfiable = u_tableau.build()
-                is_satisfiable = t3_satisfiable or u_satisfiable
-                
-                # Use primary tableau for stats and models
-                tableau = t3_tableau if t3_satisfiable else u_tableau
-                models = tableau.extract_all_models() if is_satisfiable and args.models else []
-            else:
-                tableau = classical_signed_tableau(T(formula))
-                is_satisfiable = tableau.build()
-                models = tableau.extract_all_models() if is_satisfiable and args.models else []
+            tableau, is_satisfiable = self._build_tableau(formula, logic_system)
+            models = list(islice(tableau.iter_models(), args.max_models)) if is_satisfiable and args.models else []
             
-            end_time = time.time()
+            end_ns = time.perf_counter_ns()
             
             # Prepare result data
             result_data = {
                 "formula": str(formula),
                 "logic": logic_system,
                 "satisfiable": is_satisfiable,
-                "models": models[:args.max_models] if models else []
+                "models": models
             }
             
             if args.stats:
+                stats = tableau.get_statistics()
                 result_data["statistics"] = {
-                    "construction_time": f"{end_time - start_time:.4f}s",
-                    "total_branches": len(tableau.branches),
-                    "open_branches": len([b for b in tableau.branches if not b.is_closed]),
-                    "closed_branches": len([b for b in tableau.branches if b.is_closed])
+                    "construction_time": f"{(end_ns - start_ns) / 1e9:.4f}s",
+                    "total_branches": stats["total_branches"],
+                    "open_branches": stats["open_branches"],
+                    "closed_branches": stats["closed_branches"]
                 }
             
             # Output result
@@ -413,52 +470,38 @@ Examples:
             print(f"Logic system: {logic_system}")
             print("=" * 50)
             
+            solve = partial(_solve_formula, logic_system=logic_system,
+                            want_models=args.models, max_models=args.max_models)
+            
+            if args.jobs > 1 and len(formulas) > 1:
+                # Formulas are independent: solve them in worker processes,
+                # results come back in input order
+                with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+                    outcomes = list(pool.map(solve, formulas))
+            else:
+                outcomes = map(solve, formulas)
+            
+            # Collect the report and write it once, so solving isn't
+            # interleaved with terminal I/O
             results = []
-            for i, formula_str in enumerate(formulas, 1):
-                print(f"\nFormula {i}: {formula_str}")
-                try:
-                    formula = self.parser.parse(formula_str)
-                    
-                    if logic_system == "wk3":
-                        # For weak Kleene, check if formula can be true OR undefined
-                        t3_tableau = three_valued_signed_tableau(T3(formula))
-                        u_tableau = three_valued_signed_tableau(U(formula))
-                        t3_satisfiable = t3_tableau.build()
-                        u_satisfiable = u_tableau.build()
-                        is_satisfiable = t3_satisfiable or u_satisfiable
-                        
-                        # Use primary tableau for stats and models
-                        tableau = t3_tableau if t3_satisfiable else u_tableau
-                        models = tableau.extract_all_models() if is_satisfiable and args.models else []
-                    else:
-                        tableau = classical_signed_tableau(T(formula))
-                        is_satisfiable = tableau.build()
-                        models = tableau.extract_all_models() if is_satisfiable and args.models else []
-                    
-                    result = {
-                        "formula": str(formula),
-                        "logic": logic_system,
-                        "satisfiable": is_satisfiable,
-                        "models": models[:args.max_models] if models else []
-                    }
-                    results.append(result)
-                    
-                    print(f"  Result: {'SAT' if is_satisfiable else 'UNSAT'}")
-                    if models:
-                        print(f"  Models: {len(models)}")
+            out = []
+            for i, (formula_str, (result, model_count)) in enumerate(zip(formulas, outcomes), 1):
+                out.append(f"\nFormula {i}: {formula_str}")
+                results.append(result)
                 
-                except Exception as e:
-                    print(f"  Error: {e}")
-                    results.append({
-                        "formula": formula_str,
-                        "logic": logic_system,
-                        "error": str(e)
-                    })
+                if "error" in result:
+                    out.append(f"  Error: {result['error']}")
+                else:
+                    out.append(f"  Result: {'SAT' if result['satisfiable'] else 'UNSAT'}")
+                    if model_count:
+                        out.append(f"  Models: {model_count}")
             
             # Summary output
             if args.format != "default":
                 for result in results:
-                    print(OutputFormatter.format_result(result, args.format))
+                    out.append(OutputFormatter.format_result(result, args.format))
+            
+            sys.stdout.write("\n".join(out) + "\n")
         
         except FileNotFoundError:
             print(f"Error: File '{filename}' not found")
@@ -585,32 +628,15 @@ Examples:
         """Test formula in interactive mode"""
         try:
             formula = self.parser.parse(formula_str)
-            
-            if logic_system == "wk3":
-                # For weak Kleene, check if formula can be true OR undefined
-                t3_tableau = three_valued_signed_tableau(T3(formula))
-                u_tableau = three_valued_signed_tableau(U(formula))
-                t3_satisfiable = t3_tableau.build()
-                u_satisfiable = u_tableau.build()
-                is_satisfiable = t3_satisfiable or u_satisfiable
-            else:
-                tableau = classical_signed_tableau(T(formula))
-                is_satisfiable = tableau.build()
+            tableau, is_satisfiable = self._build_tableau(formula, logic_system)
             
             print(f"Formula: {formula}")
             print(f"Logic: {logic_system.upper()}")
             print(f"Result: {'SATISFIABLE' if is_satisfiable else 'UNSATISFIABLE'}")
             
             if is_satisfiable:
-                if logic_system == "wk3":
-                    # Extract models from the satisfiable tableau
-                    if t3_satisfiable:
-                        models = t3_tableau.extract_all_models()
-                    else:
-                        models = u_tableau.extract_all_models()
-                else:
-                    models = tableau.extract_all_models()
-                print(f"Found {len(models)} model(s)")
+                model_count = sum(1 for _ in tableau.iter_models())
+                print(f"Found {model_count} model(s)")
         
         except Exception as e:
             print(f"Error: {e}")
@@ -619,27 +645,8 @@ Examples:
         """Show models for formula in interactive mode"""
         try:
             formula = self.parser.parse(formula_str)
-            
-            if logic_system == "wk3":
-                # For weak Kleene, check if formula can be true OR undefined
-                t3_tableau = three_valued_signed_tableau(T3(formula))
-                u_tableau = three_valued_signed_tableau(U(formula))
-                t3_satisfiable = t3_tableau.build()
-                u_satisfiable = u_tableau.build()
-                is_satisfiable = t3_satisfiable or u_satisfiable
-                
-                # Extract models from the satisfiable tableau
-                if is_satisfiable:
-                    if t3_satisfiable:
-                        models = t3_tableau.extract_all_models()
-                    else:
-                        models = u_tableau.extract_all_models()
-                else:
-                    models = []
-            else:
-                tableau = classical_signed_tableau(T(formula))
-                is_satisfiable = tableau.build()
-                models = tableau.extract_all_models() if is_satisfiable else []
+            tableau, is_satisfiable = self._build_tableau(formula, logic_system)
+            models = tableau.extract_all_models() if is_satisfiable else []
             
             print(f"Formula: {formula}")
             print(f"Logic: {logic_system.upper()}")
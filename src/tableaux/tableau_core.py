@@ -28,13 +28,12 @@ Author: Generated for tableau reasoning research
 License: MIT
 """
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from abc import ABC, ABCMeta, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Set, Dict, Optional, Union, Tuple, Any
-
-# Dynamic imports to avoid circular dependencies
-import copy
+from typing import List, Set, Dict, Optional, Union, Tuple, Any, FrozenSet
+from weakref import WeakValueDictionary
 
 
 # =============================================================================
@@ -42,12 +41,21 @@ import copy
 # =============================================================================
 
 class TruthValue(Enum):
-    """Three-valued truth system for weak Kleene logic"""
+    """
+    Three-valued truth system for weak Kleene logic.
+    
+    The members are the only instances, so they compare by identity
+    (`is t`). Each also carries a small integer _tag (t=0, f=1, e=2) for
+    indexing truth tables.
+    """
     
     TRUE = 't'
     FALSE = 'f'
     UNDEFINED = 'e'
     
+    def __init__(self, value: str):
+        self._tag = 'tfe'.index(value)
+    
     def __str__(self) -> str:
         """String representation using lowercase letters"""
         return self.value
@@ -64,35 +72,19 @@ class TruthValue(Enum):
     @classmethod
     def from_string(cls, value: str) -> 'TruthValue':
         """Parse TruthValue from string representation"""
-        value_map = {
-            't': cls.TRUE,
-            'f': cls.FALSE,
-            'e': cls.UNDEFINED,
-            'true': cls.TRUE,
-            'false': cls.FALSE,
-            'neither': cls.UNDEFINED,
-            'undefined': cls.UNDEFINED,
-            'gap': cls.UNDEFINED
-        }
-        
         normalized = value.lower().strip()
-        if normalized in value_map:
-            return value_map[normalized]
+        if normalized in _TRUTH_VALUE_NAMES:
+            return _TRUTH_VALUE_NAMES[normalized]
         else:
             raise ValueError(f"Invalid truth value: {value}")
     
     def to_bool(self) -> Union[bool, None]:
         """Convert to boolean (None for UNDEFINED)"""
-        if self == TruthValue.TRUE:
-            return True
-        elif self == TruthValue.FALSE:
-            return False
-        else:
-            return None
+        return (True, False, None)[self._tag]
     
     def is_classical(self) -> bool:
         """Check if this is a classical (true/false) value"""
-        return self in (TruthValue.TRUE, TruthValue.FALSE)
+        return self._tag != 2
 
 
 # Convenience aliases
@@ -100,6 +92,34 @@ t = TruthValue.TRUE
 f = TruthValue.FALSE
 e = TruthValue.UNDEFINED
 
+# Spellings accepted by TruthValue.from_string (kept outside the Enum body,
+# where a dict would become a member)
+_TRUTH_VALUE_NAMES = {
+    't': t,
+    'f': f,
+    'e': e,
+    'true': t,
+    'false': f,
+    'neither': e,
+    'undefined': e,
+    'gap': e
+}
+
+
+# weak Kleene truth tables indexed by TruthValue._tag (binary tables by
+# a._tag * 3 + b._tag, rows and columns in t, f, e order). Any 'e'
+# argument yields 'e'.
+_WK3_NEGATION = (f, t, e)
+_WK3_CONJUNCTION = (t, f, e,
+                    f, f, e,
+                    e, e, e)
+_WK3_DISJUNCTION = (t, t, e,
+                    t, f, e,
+                    e, e, e)
+_WK3_IMPLICATION = (t, f, e,
+                    t, t, e,
+                    e, e, e)
+
 
 class weakKleeneOperators:
     """Implementation of weak Kleene logic truth tables"""
@@ -107,51 +127,22 @@ class weakKleeneOperators:
     @staticmethod
     def negation(a: TruthValue) -> TruthValue:
         """weak Kleene negation: ¬A"""
-        if a == t:
-            return f
-        elif a == f:
-            return t
-        else:  # a == e
-            return e
+        return _WK3_NEGATION[a._tag]
     
     @staticmethod
     def conjunction(a: TruthValue, b: TruthValue) -> TruthValue:
         """weak Kleene conjunction: A ∧ B"""
-        # In weak Kleene, any operation with 'e' returns 'e'
-        if a == e or b == e:
-            return e
-        # If both are true, result is true
-        elif a == t and b == t:
-            return t
-        # Otherwise (at least one is false), result is false
-        else:
-            return f
+        return _WK3_CONJUNCTION[a._tag * 3 + b._tag]
     
     @staticmethod
     def disjunction(a: TruthValue, b: TruthValue) -> TruthValue:
         """weak Kleene disjunction: A ∨ B"""
-        # In weak Kleene, any operation with 'e' returns 'e'
-        if a == e or b == e:
-            return e
-        # If at least one is true, result is true
-        elif a == t or b == t:
-            return t
-        # Otherwise (both are false), result is false
-        else:
-            return f
+        return _WK3_DISJUNCTION[a._tag * 3 + b._tag]
     
     @staticmethod
     def implication(a: TruthValue, b: TruthValue) -> TruthValue:
         """weak Kleene implication: A → B"""
-        # In weak Kleene, any operation with 'e' returns 'e'
-        if a == e or b == e:
-            return e
-        # If antecedent is false, implication is true
-        elif a == f:
-            return t
-        # If antecedent is true, result depends on consequent
-        else:  # a == t
-            return b
+        return _WK3_IMPLICATION[a._tag * 3 + b._tag]
 
 
 # =============================================================================
@@ -177,6 +168,8 @@ class Term(ABC):
     for full first-order logic with unification and quantifiers.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def is_ground(self) -> bool:
         """
@@ -247,6 +240,8 @@ class Constant(Term):
     unaffected by substitutions.
     """
     
+    __slots__ = ('name',)
+    
     def __init__(self, name: str):
         """
         Create a new constant.
@@ -304,6 +299,8 @@ class Variable(Term):
     Variables are never ground and are the primary target of substitutions.
     """
     
+    __slots__ = ('name',)
+    
     def __init__(self, name: str):
         """
         Create a new variable.
@@ -363,6 +360,8 @@ class FunctionApplication(Term):
     Function applications are ground if all their arguments are ground.
     """
     
+    __slots__ = ('function_name', 'args')
+    
     def __init__(self, function_name: str, args: List[Term]):
         """
         Create a new function application.
@@ -444,8 +443,16 @@ class Formula(ABC):
     - Complexity calculation (for rule prioritization)
     - Structural analysis (atomic, literal checking)
     - Ground checking (for first-order formulas)
+    
+    The propositional connectives declare __slots__ so the many small
+    nodes built during parsing and rule application carry no per-instance
+    __dict__; Predicate and the quantified formulas keep theirs. The
+    _atoms slot caches a connective's atom names once computed (see
+    _atom_set).
     """
     
+    __slots__ = ('_hash', '_atoms', '__weakref__')
+    
     @abstractmethod
     def __str__(self) -> str:
         """Human-readable string representation"""
@@ -520,6 +527,16 @@ class Formula(ABC):
         """
         return set()  # Default for non-atomic formulas
     
+    def _components(self) -> Tuple['Formula', ...]:
+        """
+        Immediate subformulas of a propositional connective.
+        
+        Lets tree walks step into any connective with one method call
+        rather than an isinstance ladder. Atoms, predicates and quantified
+        formulas are leaves of such walks and return ().
+        """
+        return ()
+    
     @abstractmethod
     def __eq__(self, other) -> bool:
         """Structural equality comparison"""
@@ -527,11 +544,81 @@ class Formula(ABC):
     
     @abstractmethod
     def __hash__(self) -> int:
-        """Hash for use in sets and dictionaries"""
+        """
+        Hash for use in sets and dictionaries.
+        
+        Propositional formulas are immutable, so they compute their
+        structural hash once at construction from their operands' cached
+        hashes; hashing is then O(1) regardless of formula depth.
+        """
         pass
 
 
-class Atom(Formula):
+# Live propositional formulas keyed by class and constructor arguments
+# (see _InterningMeta). Entries disappear with the last reference to their
+# formula.
+_INTERNED_FORMULAS = WeakValueDictionary()
+
+
+class _InterningMeta(ABCMeta):
+    """
+    Metaclass that makes constructing an interned formula a table lookup.
+    
+    A hit returns the live instance without running __init__ again, so a
+    formula other holders already reference is never reinitialised (e.g.
+    with a different but equal Predicate as operand). A miss constructs
+    and validates normally and is only cached once __init__ succeeds.
+    
+    Interned operands are keyed by identity, since formula equality
+    ignores subclasses: Negation(Negation(p)) must not be handed the
+    instance built for Negation(MarkedNegation(p)). An interned operand
+    stays alive as long as the formula built on it, so its id is not
+    reused while the entry exists. Other arguments (names, predicates)
+    are keyed by type and value.
+    """
+    
+    def __call__(cls, *args, **kwargs):
+        if kwargs:
+            # Keyword arguments are put in _fields order, so Atom(name='p')
+            # is Atom('p'); a call that doesn't name exactly the remaining
+            # fields is left to __init__ to reject
+            names = cls._fields[len(args):]
+            if kwargs.keys() != set(names):
+                return super().__call__(*args, **kwargs)
+            args += tuple(kwargs[name] for name in names)
+        key = (cls, *((_InternedFormula, id(arg)) if isinstance(arg, _InternedFormula)
+                      else (type(arg), arg) for arg in args))
+        try:
+            instance = _INTERNED_FORMULAS.get(key)
+        except TypeError:
+            # Unhashable arguments are rejected by __init__
+            return super().__call__(*args)
+        if instance is None:
+            instance = _INTERNED_FORMULAS[key] = super().__call__(*args)
+        return instance
+
+
+class _InternedFormula(Formula, metaclass=_InterningMeta):
+    """
+    Base for the propositional formulas, which are hash-consed.
+    
+    Constructing a formula equal to a live one returns that same instance,
+    so equality checks between formulas mostly end at an identity test and
+    a subformula shared by many formulas is stored once. Subclasses name
+    their constructor arguments in _fields.
+    """
+    
+    __slots__ = ()
+    
+    _fields: Tuple[str, ...] = ()
+    
+    def __reduce__(self):
+        # Pickling and copying go back through the constructor, and so
+        # through the intern table
+        return (type(self), tuple(getattr(self, name) for name in self._fields))
+
+
+class Atom(_InternedFormula):
     """
     Propositional atom - the simplest formula type.
     
@@ -546,6 +633,9 @@ class Atom(Formula):
     always ground (no variables).
     """
     
+    __slots__ = ('name',)
+    _fields = ('name',)
+    
     def __init__(self, name: str):
         """
         Create a propositional atom.
@@ -559,6 +649,7 @@ class Atom(Formula):
         if not name or not isinstance(name, str):
             raise ValueError("Atom name must be a non-empty string")
         self.name = name
+        self._hash = hash(('atom', name))
     
     def __str__(self) -> str:
         return self.name
@@ -590,10 +681,10 @@ class Atom(Formula):
         return {self.name}
     
     def __eq__(self, other) -> bool:
-        return isinstance(other, Atom) and self.name == other.name
+        return self is other or (isinstance(other, Atom) and self.name == other.name)
     
     def __hash__(self) -> int:
-        return hash(('atom', self.name))
+        return self._hash
 
 
 class Predicate(Formula):
@@ -685,7 +776,7 @@ class Predicate(Formula):
         return hash(('predicate', self.predicate_name, tuple(self.args)))
 
 
-class Negation(Formula):
+class Negation(_InternedFormula):
     """
     Logical negation: ¬φ
     
@@ -700,6 +791,9 @@ class Negation(Formula):
     atomic formulas.
     """
     
+    __slots__ = ('operand',)
+    _fields = ('operand',)
+    
     def __init__(self, operand: Formula):
         """
         Create a negation formula.
@@ -713,6 +807,7 @@ class Negation(Formula):
         if not isinstance(operand, Formula):
             raise ValueError("Negation operand must be a Formula")
         self.operand = operand
+        self._hash = hash(('negation', operand))
     
     def __str__(self) -> str:
         # Add parentheses for complex operands
@@ -741,18 +836,21 @@ class Negation(Formula):
         """Negation complexity is operand complexity + 1"""
         return self.operand.get_complexity() + 1
     
+    def _components(self) -> Tuple[Formula, ...]:
+        return (self.operand,)
+    
     def get_atoms(self) -> Set[str]:
         """Return atoms from the operand"""
-        return self.operand.get_atoms()
+        return set(_atom_set(self))
     
     def __eq__(self, other) -> bool:
-        return isinstance(other, Negation) and self.operand == other.operand
+        return self is other or (isinstance(other, Negation) and self.operand == other.operand)
     
     def __hash__(self) -> int:
-        return hash(('negation', self.operand))
+        return self._hash
 
 
-class Conjunction(Formula):
+class Conjunction(_InternedFormula):
     """
     Logical conjunction: φ ∧ ψ
     
@@ -767,6 +865,9 @@ class Conjunction(Formula):
     in tableau construction.
     """
     
+    __slots__ = ('left', 'right')
+    _fields = ('left', 'right')
+    
     def __init__(self, left: Formula, right: Formula):
         """
         Create a conjunction formula.
@@ -782,6 +883,7 @@ class Conjunction(Formula):
             raise ValueError("Conjunction operands must be Formulas")
         self.left = left
         self.right = right
+        self._hash = hash(('conjunction', left, right))
     
     def __str__(self) -> str:
         # Parenthesize complex operands for clarity
@@ -809,19 +911,22 @@ class Conjunction(Formula):
         """Conjunction complexity is sum of operand complexities + 1"""
         return self.left.get_complexity() + self.right.get_complexity() + 1
     
+    def _components(self) -> Tuple[Formula, ...]:
+        return (self.left, self.right)
+    
     def get_atoms(self) -> Set[str]:
         """Return atoms from both operands"""
-        return self.left.get_atoms() | self.right.get_atoms()
+        return set(_atom_set(self))
     
     def __eq__(self, other) -> bool:
-        return (isinstance(other, Conjunction) and 
-                self.left == other.left and self.right == other.right)
+        return self is other or (isinstance(other, Conjunction) and
+                                 self.left == other.left and self.right == other.right)
     
     def __hash__(self) -> int:
-        return hash(('conjunction', self.left, self.right))
+        return self._hash
 
 
-class Disjunction(Formula):
+class Disjunction(_InternedFormula):
     """
     Logical disjunction: φ ∨ ψ
     
@@ -836,6 +941,9 @@ class Disjunction(Formula):
     with branching in tableau construction.
     """
     
+    __slots__ = ('left', 'right')
+    _fields = ('left', 'right')
+    
     def __init__(self, left: Formula, right: Formula):
         """
         Create a disjunction formula.
@@ -851,6 +959,7 @@ class Disjunction(Formula):
             raise ValueError("Disjunction operands must be Formulas")
         self.left = left
         self.right = right
+        self._hash = hash(('disjunction', left, right))
     
     def __str__(self) -> str:
         # Parenthesize complex operands for clarity
@@ -878,19 +987,22 @@ class Disjunction(Formula):
         """Disjunction complexity is sum of operand complexities + 1"""
         return self.left.get_complexity() + self.right.get_complexity() + 1
     
+    def _components(self) -> Tuple[Formula, ...]:
+        return (self.left, self.right)
+    
     def get_atoms(self) -> Set[str]:
         """Return atoms from both operands"""
-        return self.left.get_atoms() | self.right.get_atoms()
+        return set(_atom_set(self))
     
     def __eq__(self, other) -> bool:
-        return (isinstance(other, Disjunction) and 
-                self.left == other.left and self.right == other.right)
+        return self is other or (isinstance(other, Disjunction) and
+                                 self.left == other.left and self.right == other.right)
     
     def __hash__(self) -> int:
-        return hash(('disjunction', self.left, self.right))
+        return self._hash
 
 
-class Implication(Formula):
+class Implication(_InternedFormula):
     """
     Logical implication: φ → ψ
     
@@ -905,6 +1017,9 @@ class Implication(Formula):
     in tableau construction.
     """
     
+    __slots__ = ('antecedent', 'consequent')
+    _fields = ('antecedent', 'consequent')
+    
     def __init__(self, antecedent: Formula, consequent: Formula):
         """
         Create an implication formula.
@@ -920,6 +1035,7 @@ class Implication(Formula):
             raise ValueError("Implication operands must be Formulas")
         self.antecedent = antecedent
         self.consequent = consequent
+        self._hash = hash(('implication', antecedent, consequent))
     
     def __str__(self) -> str:
         # Parenthesize complex operands for clarity
@@ -947,16 +1063,54 @@ class Implication(Formula):
         """Implication complexity is sum of operand complexities + 1"""
         return self.antecedent.get_complexity() + self.consequent.get_complexity() + 1
     
+    def _components(self) -> Tuple[Formula, ...]:
+        return (self.antecedent, self.consequent)
+    
     def get_atoms(self) -> Set[str]:
         """Return atoms from both operands"""
-        return self.antecedent.get_atoms() | self.consequent.get_atoms()
+        return set(_atom_set(self))
     
     def __eq__(self, other) -> bool:
-        return (isinstance(other, Implication) and 
-                self.antecedent == other.antecedent and self.consequent == other.consequent)
+        return self is other or (isinstance(other, Implication) and
+                                 self.antecedent == other.antecedent and
+                                 self.consequent == other.consequent)
     
     def __hash__(self) -> int:
-        return hash(('implication', self.antecedent, self.consequent))
+        return self._hash
+
+
+def _atom_set(formula: Formula) -> FrozenSet[str]:
+    """
+    Atom names of a propositional connective, computed once per node.
+    
+    Formulas are immutable, so each connective caches its set in its
+    _atoms slot and later get_atoms() calls only copy it. The walk is an
+    explicit-stack post-order over the connectives that lack a cache, so
+    every subformula is computed once from its components' sets: sharing
+    (common with interned formulas) costs the DAG size, not the tree size,
+    and depth costs no recursion. Leaves (atoms, predicates, quantified
+    formulas) contribute their own get_atoms().
+    """
+    try:
+        return formula._atoms
+    except AttributeError:
+        pass
+    stack = [(formula, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if hasattr(node, '_atoms'):
+            continue
+        components = node._components()
+        if not expanded:
+            # Visit again once every compound component has its set
+            stack.append((node, True))
+            stack.extend((component, False) for component in components
+                         if component._components() and not hasattr(component, '_atoms'))
+            continue
+        node._atoms = frozenset().union(*(
+            component._atoms if component._components() else component.get_atoms()
+            for component in components))
+    return formula._atoms
 
 
 class RestrictedExistentialFormula(Formula):
@@ -1140,6 +1294,8 @@ class Sign(ABC):
     non-classical logics in the tableau framework.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def __str__(self) -> str:
         """String representation of the sign"""
@@ -1191,7 +1347,36 @@ class Sign(ABC):
         pass
 
 
-class ClassicalSign(Sign):
+class _InternedSign(Sign):
+    """
+    Base for sign systems with a fixed set of designations.
+    
+    Such signs are immutable and few, so each subclass interns one
+    instance per valid designation (listed in its _designations) and
+    equal signs are usually identical. Subclasses define their own
+    _instances dict.
+    """
+    
+    __slots__ = ()
+    
+    _designations: frozenset = frozenset()
+    _instances: Dict[str, 'Sign']
+    
+    def __new__(cls, designation: str):
+        instance = cls._instances.get(designation)
+        if instance is None:
+            instance = super().__new__(cls)
+            # Invalid designations are rejected by __init__, never cached
+            if designation in cls._designations:
+                cls._instances[designation] = instance
+        return instance
+    
+    def __getnewargs__(self):
+        # Pickling and copying go back through __new__ to the interned sign
+        return (self.designation,)
+
+
+class ClassicalSign(_InternedSign):
     """
     Classical two-valued signs: T (true) and F (false).
     
@@ -1206,6 +1391,11 @@ class ClassicalSign(Sign):
         F:(p → q) (p → q must be false)
     """
     
+    __slots__ = ('designation', 'value')
+    
+    _designations = frozenset({"T", "F"})
+    _instances = {}
+    
     def __init__(self, designation: str):
         """
         Create a classical sign.
@@ -1213,7 +1403,7 @@ class ClassicalSign(Sign):
         Args:
             designation: "T" for true sign, "F" for false sign
         """
-        if designation not in {"T", "F"}:
+        if designation not in self._designations:
             raise ValueError(f"Invalid classical sign: {designation}")
         self.designation = designation
         self.value = designation == "T"
@@ -1222,7 +1412,7 @@ class ClassicalSign(Sign):
         return self.designation
     
     def __eq__(self, other) -> bool:
-        return isinstance(other, ClassicalSign) and self.designation == other.designation
+        return self is other or (isinstance(other, ClassicalSign) and self.designation == other.designation)
     
     def __hash__(self) -> int:
         return hash(("classical", self.designation))
@@ -1236,7 +1426,7 @@ class ClassicalSign(Sign):
         return t if self.value else f
 
 
-class ThreeValuedSign(Sign):
+class ThreeValuedSign(_InternedSign):
     """
     Three-valued signs: T (true), F (false), U (undefined).
     
@@ -1253,6 +1443,11 @@ class ThreeValuedSign(Sign):
         U:p (p has no definite truth value)
     """
     
+    __slots__ = ('designation', 'value')
+    
+    _designations = frozenset({"T", "F", "U"})
+    _instances = {}
+    
     def __init__(self, designation: str):
         """
         Create a three-valued sign.
@@ -1263,7 +1458,7 @@ class ThreeValuedSign(Sign):
         Raises:
             ValueError: If designation is not valid
         """
-        if designation not in {"T", "F", "U"}:
+        if designation not in self._designations:
             raise ValueError(f"Invalid three-valued sign: {designation}")
         self.designation = designation
         
@@ -1279,7 +1474,7 @@ class ThreeValuedSign(Sign):
         return self.designation
     
     def __eq__(self, other) -> bool:
-        return isinstance(other, ThreeValuedSign) and self.designation == other.designation
+        return self is other or (isinstance(other, ThreeValuedSign) and self.designation == other.designation)
     
     def __hash__(self) -> int:
         return hash(("three_valued", self.designation))
@@ -1296,15 +1491,26 @@ class ThreeValuedSign(Sign):
             return False
         
         # Only T and F create contradictions in three-valued logic
-        return ((self.value == t and other.value == f) or 
-                (self.value == f and other.value == t))
+        return ((self.value is t and other.value is f) or 
+                (self.value is f and other.value is t))
     
     def get_truth_value(self) -> TruthValue:
         """Direct mapping to truth value"""
         return self.value
 
 
-class WkrqSign(Sign):
+# wKrQ sign tables, shared by all WkrqSign methods rather than rebuilt per call
+_WKRQ_TRUTH_VALUES = {
+    "T": t,
+    "F": f,
+    "M": e,  # May be true -> undefined
+    "N": e   # Need not be true -> undefined
+}
+_WKRQ_DUALS = {"T": "F", "F": "T", "M": "N", "N": "M"}
+_WKRQ_CONTRADICTORY = frozenset({("T", "F"), ("F", "T")})
+
+
+class WkrqSign(_InternedSign):
     """
     wKrQ signs: T, F, M (may be true), N (need not be true).
     
@@ -1331,6 +1537,11 @@ class WkrqSign(Sign):
         N:p (p need not be true - epistemic possibility of falsehood)
     """
     
+    __slots__ = ('designation',)
+    
+    _designations = frozenset({"T", "F", "M", "N"})
+    _instances = {}
+    
     def __init__(self, designation: str):
         """
         Create a wKrQ sign.
@@ -1341,7 +1552,7 @@ class WkrqSign(Sign):
         Raises:
             ValueError: If designation is not a valid wKrQ sign
         """
-        if designation not in {"T", "F", "M", "N"}:
+        if designation not in self._designations:
             raise ValueError(f"Invalid wKrQ sign: {designation}")
         self.designation = designation
     
@@ -1349,7 +1560,7 @@ class WkrqSign(Sign):
         return self.designation
     
     def __eq__(self, other) -> bool:
-        return isinstance(other, WkrqSign) and self.designation == other.designation
+        return self is other or (isinstance(other, WkrqSign) and self.designation == other.designation)
     
     def __hash__(self) -> int:
         return hash(("wkrq", self.designation))
@@ -1366,8 +1577,7 @@ class WkrqSign(Sign):
         
         # Only T and F create contradictions in wKrQ logic
         # M and N represent uncertainty and don't close branches
-        contradictory_pairs = {("T", "F"), ("F", "T")}
-        return (self.designation, other.designation) in contradictory_pairs
+        return (self.designation, other.designation) in _WKRQ_CONTRADICTORY
     
     def get_truth_value(self) -> Optional[TruthValue]:
         """
@@ -1376,13 +1586,7 @@ class WkrqSign(Sign):
         - F maps to false (f)  
         - M and N represent uncertainty and map to undefined (e)
         """
-        mapping = {
-            "T": t,
-            "F": f,
-            "M": e,  # May be true -> undefined
-            "N": e   # Need not be true -> undefined
-        }
-        return mapping.get(self.designation, e)
+        return _WKRQ_TRUTH_VALUES.get(self.designation, e)
     
     def is_definite(self) -> bool:
         """Check if this is a definite sign (T or F)"""
@@ -1403,20 +1607,22 @@ class WkrqSign(Sign):
         Returns:
             Dual sign for use in negation tableau rules
         """
-        dual_mapping = {
-            "T": "F",
-            "F": "T", 
-            "M": "N",
-            "N": "M"
-        }
-        return WkrqSign(dual_mapping[self.designation])
+        return WkrqSign(_WKRQ_DUALS[self.designation])
+
+
+# Sign instances per sign system, keyed by designation. The classes intern
+# their instances anyway; these tables let the signed-formula constructors
+# and the engine's rule tables skip the constructor call entirely.
+_CLASSICAL_SIGNS = {d: ClassicalSign(d) for d in ("T", "F")}
+_THREE_VALUED_SIGNS = {d: ThreeValuedSign(d) for d in ("T", "F", "U")}
+_WKRQ_SIGNS = {d: WkrqSign(d) for d in ("T", "F", "M", "N")}
 
 
 # =============================================================================
 # SIGNED FORMULAS (The Core Unit of Tableau Reasoning)
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignedFormula:
     """
     A signed formula: the fundamental unit of tableau reasoning.
@@ -1435,6 +1641,7 @@ class SignedFormula:
     
     Signed formulas are:
     - Immutable (frozen dataclass) for safe use in sets/dicts
+    - Slotted, so the many instances built during expansion stay small
     - Hashable for efficient tableau branch management
     - Comparable for rule prioritization
     - Extensible to any sign system and formula type
@@ -1546,39 +1753,39 @@ class SignedFormula:
 
 def T(formula: Formula) -> SignedFormula:
     """Create T:formula for classical logic (true)"""
-    return SignedFormula(ClassicalSign("T"), formula)
+    return SignedFormula(_CLASSICAL_SIGNS["T"], formula)
 
 def F(formula: Formula) -> SignedFormula:
     """Create F:formula for classical logic (false)"""
-    return SignedFormula(ClassicalSign("F"), formula)
+    return SignedFormula(_CLASSICAL_SIGNS["F"], formula)
 
 def T3(formula: Formula) -> SignedFormula:
     """Create T:formula for three-valued logic (true)"""
-    return SignedFormula(ThreeValuedSign("T"), formula)
+    return SignedFormula(_THREE_VALUED_SIGNS["T"], formula)
 
 def F3(formula: Formula) -> SignedFormula:
     """Create F:formula for three-valued logic (false)"""
-    return SignedFormula(ThreeValuedSign("F"), formula)
+    return SignedFormula(_THREE_VALUED_SIGNS["F"], formula)
 
 def U(formula: Formula) -> SignedFormula:
     """Create U:formula for three-valued logic (undefined)"""
-    return SignedFormula(ThreeValuedSign("U"), formula)
+    return SignedFormula(_THREE_VALUED_SIGNS["U"], formula)
 
 def TF(formula: Formula) -> SignedFormula:
     """Create T:formula for wKrQ logic (definitely true)"""
-    return SignedFormula(WkrqSign("T"), formula)
+    return SignedFormula(_WKRQ_SIGNS["T"], formula)
 
 def FF(formula: Formula) -> SignedFormula:
     """Create F:formula for wKrQ logic (definitely false)"""
-    return SignedFormula(WkrqSign("F"), formula)
+    return SignedFormula(_WKRQ_SIGNS["F"], formula)
 
 def M(formula: Formula) -> SignedFormula:
     """Create M:formula for wKrQ logic (may be true)"""
-    return SignedFormula(WkrqSign("M"), formula)
+    return SignedFormula(_WKRQ_SIGNS["M"], formula)
 
 def N(formula: Formula) -> SignedFormula:
     """Create N:formula for wKrQ logic (need not be true)"""
-    return SignedFormula(WkrqSign("N"), formula)
+    return SignedFormula(_WKRQ_SIGNS["N"], formula)
 
 
 # =============================================================================
@@ -1723,10 +1930,10 @@ def dual_sign(sign: Sign) -> Sign:
     elif isinstance(sign, ClassicalSign):
         return ClassicalSign("F" if sign.designation == "T" else "T")
     elif isinstance(sign, ThreeValuedSign):
-        if sign.value == t:
-            return ThreeValuedSign(f)
-        elif sign.value == f:
-            return ThreeValuedSign(t)
+        if sign.value is t:
+            return ThreeValuedSign("F")
+        elif sign.value is f:
+            return ThreeValuedSign("T")
         else:  # e
             return sign  # U is its own dual
     elif isinstance(sign, WkrqSign):
@@ -1847,12 +2054,6 @@ def parse_formula(formula_str: str) -> Formula:
 # OPTIMIZED TABLEAU ENGINE (UNIFIED SYSTEM)
 # =============================================================================
 
-from typing import List, Set, Dict, Optional, Union, Tuple, Any
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from collections import defaultdict, deque
-import time
-
 @dataclass
 class TableauRule:
     """
@@ -1867,6 +2068,27 @@ class TableauRule:
     conclusions: List[List[Any]]  # Output branches (single branch for alpha, multiple for beta)
     priority: int  # Lower number = higher priority (alpha rules get priority 1, beta rules get priority 2)
     name: str = ""  # Human-readable rule name for visualization
+    # Conclusions precompiled by the engine into (sign, subformula slot) pairs
+    compiled_conclusions: List[Tuple[Tuple[Any, int], ...]] = field(
+        default_factory=list, repr=False, compare=False)
+
+# Compiled rule tables shared by engines of the same class and sign
+# system, see OptimizedTableauEngine._rule_table
+_RULE_TABLES = {}
+
+# Formula kind named in the rule keys of each connective class
+_RULE_FORMULA_KINDS = {
+    Negation: 'negation',
+    Conjunction: 'conjunction',
+    Disjunction: 'disjunction',
+    Implication: 'implication',
+}
+
+# Signs whose meeting on one formula closes a branch, as bits of the
+# TableauBranch.formula_signs masks (other signs, e.g. U, M and N, set none)
+_CLOSURE_SIGN_BITS = {'T': 1, 'F': 2}
+_CLOSED_SIGNS = 3
+
 
 class TableauBranch:
     """
@@ -1878,9 +2100,11 @@ class TableauBranch:
     
     def __init__(self, signed_formulas: List[Any], parent_branch=None, branch_id=None):
         self.signed_formulas = signed_formulas[:]  # All formulas on this branch
+        self.formula_set = set(signed_formulas)  # Same formulas, for O(1) membership
         self.processed_formulas = set()  # Formulas that have been expanded
         self.is_closed = False
-        self.closure_reason = None  # (sf1, sf2) that caused closure
+        self._closing_formula = None  # Formula signed both T and F, once closed
+        self._closure_reason = None  # (sf1, sf2), built on first access
         
         # Tree structure tracking
         self.parent_branch = parent_branch  # Reference to parent branch (None for root)
@@ -1889,43 +2113,29 @@ class TableauBranch:
         self.depth = 0 if parent_branch is None else parent_branch.depth + 1  # Depth in tree
         
         # O(1) closure detection data structures
-        # Map: formula -> set of signs for that formula
-        self.formula_signs: Dict[Any, Set[str]] = defaultdict(set)
+        # Map: formula -> bitmask of its closing signs (see _CLOSURE_SIGN_BITS)
+        self.formula_signs: Dict[Formula, int] = defaultdict(int)
         
         # Build initial formula-sign mapping
         self._update_closure_tracking()
         
     def _update_closure_tracking(self):
         """
-        Update closure tracking structures after adding new formulas.
-        Implements O(1) amortized closure detection.
+        Build closure tracking structures from all formulas on the branch.
+        Implements O(1) amortized closure detection; add_formulas() then
+        keeps them up to date incrementally.
         """
-        # Clear and rebuild formula-sign mapping  
-        self.formula_signs = defaultdict(set)
+        # Clear and rebuild formula-sign mapping. Formulas hash and compare
+        # structurally, so they key the map directly: P(a) and P(b), or an
+        # atom and a compound formula that print alike, stay distinct.
+        self.formula_signs = defaultdict(int)
         
         for sf in self.signed_formulas:
-            formula_key = self._get_formula_key(sf.formula)
-            sign_str = str(sf.sign)
-            self.formula_signs[formula_key].add(sign_str)
+            self.formula_signs[sf.formula] |= _CLOSURE_SIGN_BITS.get(str(sf.sign), 0)
             
         # Check for closure after update
         self._check_closure()
     
-    def _get_formula_key(self, formula):
-        """
-        Get a hashable key for formula comparison.
-        Handles atomic formulas and predicates uniformly.
-        """
-        if hasattr(formula, 'name'):  # Atomic formula
-            return ('atom', formula.name)
-        elif hasattr(formula, 'predicate_name'):  # Predicate formula
-            # For predicates, include the predicate name and arguments
-            args_key = tuple(str(arg) for arg in formula.arguments) if hasattr(formula, 'arguments') else ()
-            return ('predicate', formula.predicate_name, args_key)
-        else:
-            # For complex formulas, use string representation as key
-            return ('complex', str(formula))
-    
     def _check_closure(self):
         """
         Check if branch is closed due to contradictory signs.
@@ -1937,22 +2147,52 @@ class TableauBranch:
         
         Reference: Ferguson, T. M. (2021). Tableaux and restricted quantification.
         """
-        for formula_key, signs in self.formula_signs.items():
+        for formula, signs in self.formula_signs.items():
             # Check for classical contradictions (T and F on same formula)
-            if 'T' in signs and 'F' in signs:
+            if signs == _CLOSED_SIGNS:
                 self.is_closed = True
-                # Find the actual signed formulas for closure reason
-                sf1 = next(sf for sf in self.signed_formulas 
-                          if self._get_formula_key(sf.formula) == formula_key and str(sf.sign) == 'T')
-                sf2 = next(sf for sf in self.signed_formulas 
-                          if self._get_formula_key(sf.formula) == formula_key and str(sf.sign) == 'F')
-                self.closure_reason = (sf1, sf2)
+                # The signed formulas are looked up only if the reason is read
+                if formula is not self._closing_formula:
+                    self._closing_formula = formula
+                    self._closure_reason = None
                 return
     
+    @property
+    def closure_reason(self):
+        """The (T:A, F:A) pair that closed this branch, or None while open"""
+        if self._closure_reason is None and self._closing_formula is not None:
+            formula = self._closing_formula
+            sf1 = next(sf for sf in self.signed_formulas 
+                      if sf.formula == formula and str(sf.sign) == 'T')
+            sf2 = next(sf for sf in self.signed_formulas 
+                      if sf.formula == formula and str(sf.sign) == 'F')
+            self._closure_reason = (sf1, sf2)
+        return self._closure_reason
+    
     def add_formulas(self, new_formulas: List[Any]):
-        """Add new formulas to branch and update closure tracking."""
-        self.signed_formulas.extend(new_formulas)
-        self._update_closure_tracking()
+        """
+        Add new formulas to branch and update closure tracking.
+        
+        Signed formulas already on the branch are skipped: a structurally
+        identical copy adds no information and would only be expanded again.
+        """
+        # dict.fromkeys drops repeats within new_formulas, keeping order
+        fresh = [sf for sf in dict.fromkeys(new_formulas) if sf not in self.formula_set]
+        self.formula_set.update(fresh)
+        self.signed_formulas.extend(fresh)
+        
+        # Only the new formulas' signs can newly close the branch, so they
+        # are folded into the existing masks rather than rebuilding them,
+        # and the masks are only scanned once one of them closes
+        formula_signs = self.formula_signs
+        closes = False
+        for sf in fresh:
+            signs = formula_signs[sf.formula] | _CLOSURE_SIGN_BITS.get(str(sf.sign), 0)
+            formula_signs[sf.formula] = signs
+            if signs == _CLOSED_SIGNS:
+                closes = True
+        if closes:
+            self._check_closure()
     
     def mark_processed(self, signed_formula: Any):
         """Mark a formula as processed to avoid re-expansion."""
@@ -1963,13 +2203,25 @@ class TableauBranch:
         return id(signed_formula) in self.processed_formulas
     
     def copy(self, parent_branch=None, branch_id=None) -> 'TableauBranch':
-        """Create a copy of this branch for β-rule expansion."""
-        new_branch = TableauBranch([], parent_branch=parent_branch, branch_id=branch_id)
+        """
+        Create a copy of this branch for β-rule expansion.
+        
+        Bypasses __init__, which would scan the (empty) formula list for
+        closure only to have every field overwritten. Signed formulas are
+        immutable, so only the containers are copied.
+        """
+        new_branch = type(self).__new__(type(self))
+        new_branch.parent_branch = parent_branch
+        new_branch.child_branches = []
+        new_branch.branch_id = branch_id if branch_id is not None else 0
+        new_branch.depth = 0 if parent_branch is None else parent_branch.depth + 1
         new_branch.signed_formulas = self.signed_formulas[:]
+        new_branch.formula_set = self.formula_set.copy()
         new_branch.processed_formulas = self.processed_formulas.copy()
-        new_branch.formula_signs = {k: v.copy() for k, v in self.formula_signs.items()}
+        new_branch.formula_signs = self.formula_signs.copy()
         new_branch.is_closed = self.is_closed
-        new_branch.closure_reason = self.closure_reason
+        new_branch._closing_formula = self._closing_formula
+        new_branch._closure_reason = self._closure_reason
         return new_branch
 
 class OptimizedTableauEngine:
@@ -1997,7 +2249,11 @@ class OptimizedTableauEngine:
         self.sign_system = sign_system  # "classical", "wk3"/"three_valued", "wkrq"
         self.initial_signed_formulas = []
         self.branches: List[TableauBranch] = []
-        self.rules = self._initialize_tableau_rules()
+        self.rules = self._rule_table()
+        # Lookups derived from self.rules, rebuilt by _prepare_rules()
+        self._rules_by_kind = {}  # (sign, formula class) -> (rules, best), see _rules_for
+        self._best_rule_key = None  # Priority key no rule can beat, see _select_rule
+        self._conclusion_cache = {}  # see _instantiate_rule_conclusions
         self._satisfiable = None
         
         # Construction step tracking for visualization
@@ -2012,8 +2268,28 @@ class OptimizedTableauEngine:
             'beta_applications': 0,
             'branches_created': 0,
             'branches_closed': 0,
-            'subsumptions_eliminated': 0
+            'subsumptions_eliminated': 0,
+            'fast_path_hit': False
         }
+        self._statistics = None  # Snapshot built lazily by get_statistics()
+        self._models = None  # Built lazily by extract_all_models()
+    
+    def _rule_table(self) -> Dict[str, List[TableauRule]]:
+        """
+        Compiled rules for this engine's class and sign system.
+        
+        Rules never change once compiled, so they are built and compiled
+        for the first engine of a kind and shared with the later ones,
+        which is most of the cost of a fresh engine. Each engine gets its
+        own dict and lists, so adding rules to one affects no other.
+        """
+        key = (type(self), self.sign_system)
+        shared = _RULE_TABLES.get(key)
+        if shared is None:
+            self.rules = self._initialize_tableau_rules()
+            self._compile_rule_conclusions()
+            shared = _RULE_TABLES[key] = self.rules
+        return defaultdict(list, {rule_key: list(rule_list) for rule_key, rule_list in shared.items()})
     
     def _initialize_tableau_rules(self) -> Dict[str, List[TableauRule]]:
         """
@@ -2031,74 +2307,7 @@ class OptimizedTableauEngine:
         if self.sign_system == "classical":
             # Classical propositional logic rules
             # Reference: Smullyan (1968), Chapter 2
-            
-            # Conjunction rules
-            rules['T_conjunction'] = [TableauRule(
-                rule_type="alpha",
-                premises=["T:(A ∧ B)"],
-                conclusions=[["T:A", "T:B"]],
-                priority=1,
-                name="T-Conjunction (α)"
-            )]
-            
-            rules['F_conjunction'] = [TableauRule(
-                rule_type="beta", 
-                premises=["F:(A ∧ B)"],
-                conclusions=[["F:A"], ["F:B"]],
-                priority=2,
-                name="F-Conjunction (β)"
-            )]
-            
-            # Disjunction rules  
-            rules['T_disjunction'] = [TableauRule(
-                rule_type="beta",
-                premises=["T:(A ∨ B)"],
-                conclusions=[["T:A"], ["T:B"]],
-                priority=2,
-                name="T-Disjunction (β)"
-            )]
-            
-            rules['F_disjunction'] = [TableauRule(
-                rule_type="alpha",
-                premises=["F:(A ∨ B)"],  
-                conclusions=[["F:A", "F:B"]],
-                priority=1,
-                name="F-Disjunction (α)"
-            )]
-            
-            # Implication rules
-            rules['T_implication'] = [TableauRule(
-                rule_type="beta",
-                premises=["T:(A → B)"],
-                conclusions=[["F:A"], ["T:B"]],
-                priority=2,
-                name="T-Implication (β)"
-            )]
-            
-            rules['F_implication'] = [TableauRule(
-                rule_type="alpha",
-                premises=["F:(A → B)"],
-                conclusions=[["T:A", "F:B"]],
-                priority=1,
-                name="F-Implication (α)"
-            )]
-            
-            # Negation rules
-            rules['T_negation'] = [TableauRule(
-                rule_type="alpha",
-                premises=["T:¬A"],
-                conclusions=[["F:A"]],
-                priority=1,
-                name="T-Negation (α)"
-            )]
-            
-            rules['F_negation'] = [TableauRule(
-                rule_type="alpha", 
-                premises=["F:¬A"],
-                conclusions=[["T:A"]],
-                priority=1,
-                name="F-Negation (α)"
-            )]
+            rules.update(self._get_classical_rules())
         
         elif self.sign_system in ["wk3", "three_valued"]:
             # weak Kleene three-valued logic rules
@@ -2140,11 +2349,15 @@ class OptimizedTableauEngine:
         return rules
     
     def _get_classical_rules(self) -> Dict[str, List[TableauRule]]:
-        """Helper to get classical rule base for multi-valued logics."""
-        # Create classical rules manually to avoid recursion
+        """
+        Classical T/F rule base.
+        
+        Used directly for classical logic and as the starting point for the
+        multi-valued systems, which only add rules for their extra signs.
+        """
         rules = defaultdict(list)
         
-        # Classical propositional logic rules (duplicate from classical case)
+        # Conjunction rules
         rules['T_conjunction'] = [TableauRule(
             rule_type="alpha",
             premises=["T:(A ∧ B)"],
@@ -2161,6 +2374,7 @@ class OptimizedTableauEngine:
             name="F-Conjunction (β)"
         )]
         
+        # Disjunction rules
         rules['T_disjunction'] = [TableauRule(
             rule_type="beta",
             premises=["T:(A ∨ B)"],
@@ -2177,6 +2391,7 @@ class OptimizedTableauEngine:
             name="F-Disjunction (α)"
         )]
         
+        # Implication rules
         rules['T_implication'] = [TableauRule(
             rule_type="beta",
             premises=["T:(A → B)"],
@@ -2193,6 +2408,7 @@ class OptimizedTableauEngine:
             name="F-Implication (α)"
         )]
         
+        # Negation rules
         rules['T_negation'] = [TableauRule(
             rule_type="alpha",
             premises=["T:¬A"],
@@ -2211,6 +2427,83 @@ class OptimizedTableauEngine:
         
         return rules
     
+    # Template placeholders mapped to positions in a premise's subformula tuple
+    _TEMPLATE_SLOTS = {'A': 0, 'B': 1}
+    
+    def _compile_rule_conclusions(self, uncompiled_only: bool = False):
+        """
+        Precompile rule conclusion templates into (sign, slot) pairs.
+        
+        Templates such as "T:A" are parsed once here, so applying a rule only
+        pairs ready-made signs with the premise's subformulas instead of
+        splitting strings and constructing signs on every application.
+        Templates that are invalid for the sign system are dropped.
+        
+        Args:
+            uncompiled_only: Skip rules that already have compiled
+                conclusions, e.g. to compile rules added after construction
+        """
+        if self.sign_system == "classical":
+            signs = _CLASSICAL_SIGNS
+        elif self.sign_system in ["wk3", "three_valued"]:
+            signs = _THREE_VALUED_SIGNS
+        elif self.sign_system == "wkrq":
+            signs = _WKRQ_SIGNS
+        else:
+            signs = {}
+        
+        for rule_list in self.rules.values():
+            for rule in rule_list:
+                if uncompiled_only and rule.compiled_conclusions:
+                    continue
+                rule.compiled_conclusions = []
+                for conclusion_set in rule.conclusions:
+                    compiled = []
+                    for template in conclusion_set:
+                        sign_str, _, slot_name = template.partition(':')
+                        if sign_str in signs and slot_name in self._TEMPLATE_SLOTS:
+                            compiled.append((signs[sign_str], self._TEMPLATE_SLOTS[slot_name]))
+                    rule.compiled_conclusions.append(tuple(compiled))
+    
+    def _prepare_rules(self):
+        """
+        Bring the rule lookups up to date with self.rules before a build.
+        
+        Rules may be added to or replaced in self.rules after construction,
+        so any rule without compiled conclusions is compiled here and the
+        lookups derived from the table are rebuilt.
+        """
+        self._compile_rule_conclusions(uncompiled_only=True)
+        self._rules_by_kind = {}
+        self._best_rule_key = min(((rule.priority, rule.rule_type)
+                                   for rule_list in self.rules.values() for rule in rule_list),
+                                  default=None)
+    
+    def reset(self, signed_formulas: List[Any] = None):
+        """
+        Discard the current tableau so the engine can be reused.
+        
+        Branches, statistics and recorded steps are cleared; the rule tables
+        and their compiled conclusions are kept, which is what makes reuse
+        cheaper than constructing a new engine. Step tracking stays enabled
+        if it was enabled.
+        
+        Args:
+            signed_formulas: If given, build a new tableau from them
+        """
+        self.initial_signed_formulas = []
+        self.branches = []
+        self._satisfiable = None
+        self.construction_steps = []
+        self.next_branch_id = 1
+        self.stats = dict.fromkeys(self.stats, 0)
+        self.stats['fast_path_hit'] = False
+        self._statistics = None
+        self._models = None
+        
+        if signed_formulas is not None:
+            self.build_tableau(signed_formulas)
+    
     def enable_step_tracking(self):
         """Enable construction step tracking for visualization."""
         self.track_construction = True
@@ -2365,6 +2658,15 @@ class OptimizedTableauEngine:
         4. Apply subsumption elimination to remove redundant branches
         """
         self.initial_signed_formulas = signed_formulas[:]
+        self._statistics = None
+        self._models = None
+        self._prepare_rules()
+        self._conclusion_cache = {}
+        
+        # Statistics describe this construction only; the closed count in
+        # particular is kept as a running total below
+        self.stats = dict.fromkeys(self.stats, 0)
+        self.stats['fast_path_hit'] = False
         
         # Initialize tableau with single branch
         initial_branch = TableauBranch(signed_formulas, parent_branch=None, branch_id=0)
@@ -2381,53 +2683,54 @@ class OptimizedTableauEngine:
             self._satisfiable = False
             return
         
-        # Main tableau construction loop with optimized rule application
+        # Fast path: atomic formulas have no expansion rules, so an initial
+        # branch made only of them is already complete and, having not
+        # closed above, open
+        if all(sf.formula.is_atomic() for sf in signed_formulas):
+            self.stats['fast_path_hit'] = True
+            self._satisfiable = True
+            self._record_step('completion', 'Construction complete - formula is satisfiable (open branches: [0])')
+            return
+        
+        # Main tableau construction loop with optimized rule application.
+        # An open branch with no applicable rule stays that way (only rule
+        # applications change a branch), so such branches are remembered
+        # and not searched for rules again on later passes.
+        saturated = set()
         changed = True
         while changed:
             changed = False
             
-            # Store rule applications to record after branch update
+            # Store rule applications to record after branch update, as
+            # (branch_index, signed_formula, rule, result_branches, seen)
+            # tuples; the step descriptions are only formatted when
+            # construction is being tracked
             rule_applications = []
             
-            # Process all branches, applying rules with α/β prioritization
+            # Process all branches, applying rules with α/β prioritization,
+            # and count the open ones as they are placed
             new_branches = []
-            for branch in self.branches:
+            open_count = 0
+            for branch_index, branch in enumerate(self.branches):
                 if branch.is_closed:
                     new_branches.append(branch)
                     continue
                 
-                # Find highest priority applicable rule
+                # Find highest priority applicable rule (α-rules first)
                 rule_applied = False
-                applicable_rules = self._find_applicable_rules(branch)
+                selected = self._select_rule(branch) if branch not in saturated else None
                 
-                if applicable_rules:
-                    # Sort by priority (α-rules first)
-                    applicable_rules.sort(key=lambda x: (x[1].priority, x[1].rule_type))
-                    signed_formula, rule = applicable_rules[0]
+                if selected:
+                    signed_formula, rule = selected
                     
-                    # Apply the rule
+                    # Apply the rule (an α-rule extends branch itself, so its
+                    # length is taken first)
+                    seen = len(branch.signed_formulas)
                     result_branches = self._apply_rule(branch, signed_formula, rule)
                     
                     # Store rule application info for later recording
-                    branch_index = self.branches.index(branch)
-                    rule_name = rule.name if rule.name else f"{rule.rule_type}-rule"
-                    rule_desc = f"Apply {rule_name} to {signed_formula}"
-                    if rule.rule_type == "beta" and len(result_branches) > 1:
-                        rule_desc += f" (creates {len(result_branches)} branches)"
-                    
-                    # Get new formulas added by this rule
-                    new_formulas = []
-                    for result_branch in result_branches:
-                        for sf in result_branch.signed_formulas:
-                            if sf not in branch.signed_formulas:
-                                new_formulas.append(str(sf))
-                    
-                    rule_applications.append({
-                        'desc': rule_desc,
-                        'branch_index': branch_index,
-                        'rule_name': rule_name,
-                        'new_formulas': new_formulas
-                    })
+                    if self.track_construction:
+                        rule_applications.append((branch_index, signed_formula, rule, result_branches, seen))
                     
                     new_branches.extend(result_branches)
                     
@@ -2435,7 +2738,11 @@ class OptimizedTableauEngine:
                     for result_branch in result_branches:
                         result_branch.mark_processed(signed_formula)
                     
-                    # Update statistics
+                    # Update statistics; closed branches are never reopened or
+                    # removed, so the closed count only grows by new closures
+                    newly_closed = sum(1 for b in result_branches if b.is_closed)
+                    self.stats['branches_closed'] += newly_closed
+                    open_count += len(result_branches) - newly_closed
                     self.stats['rule_applications'] += 1
                     if rule.rule_type == "alpha":
                         self.stats['alpha_applications'] += 1
@@ -2447,62 +2754,117 @@ class OptimizedTableauEngine:
                     changed = True
                 
                 if not rule_applied:
+                    saturated.add(branch)
                     new_branches.append(branch)
+                    open_count += 1
             
             # Update branches
             self.branches = new_branches
             
             # Record rule applications after branch update
-            for rule_app in rule_applications:
-                self._record_step('rule_application', rule_app['desc'], rule_app['branch_index'], 
-                                applied_rule=rule_app['rule_name'], new_formulas=rule_app['new_formulas'])
-            
-            # Count closed branches
-            self.stats['branches_closed'] = sum(1 for b in self.branches if b.is_closed)
+            for branch_index, signed_formula, rule, result_branches, seen in rule_applications:
+                rule_name = rule.name if rule.name else f"{rule.rule_type}-rule"
+                rule_desc = f"Apply {rule_name} to {signed_formula}"
+                if rule.rule_type == "beta" and len(result_branches) > 1:
+                    rule_desc += f" (creates {len(result_branches)} branches)"
+                
+                # Get new formulas added by this rule. Result branches are
+                # the expanded branch or copies of it that add_formulas()
+                # only appended to, so the new formulas are exactly their
+                # tails.
+                new_formulas = [str(sf) for result_branch in result_branches
+                                for sf in result_branch.signed_formulas[seen:]]
+                
+                self._record_step('rule_application', rule_desc, branch_index, 
+                                applied_rule=rule_name, new_formulas=new_formulas)
             
-            # Record closures
-            for i, branch in enumerate(self.branches):
-                if branch.is_closed and branch.closure_reason:
-                    self._record_step('closure', f'Branch {i} closes: contradiction found', i)
+            # Record closures (only when tracking, so that closure reasons
+            # are not built just to be discarded)
+            if self.track_construction:
+                for i, branch in enumerate(self.branches):
+                    if branch.is_closed and branch.closure_reason:
+                        self._record_step('closure', f'Branch {i} closes: contradiction found', i)
             
             # Early termination: if all branches are closed, tableau is unsatisfiable
-            if all(branch.is_closed for branch in self.branches):
+            if not open_count:
                 self._record_step('completion', 'All branches closed - formula is unsatisfiable')
                 self._satisfiable = False
                 return
             
-            # Apply subsumption elimination optimization
-            self._eliminate_subsumed_branches()
-        
-        # Determine final satisfiability
-        self._satisfiable = any(not branch.is_closed for branch in self.branches)
-        
-        # Record completion
-        if self._satisfiable:
+            # Apply subsumption elimination optimization. A pass that applied
+            # no rule left the branches as the previous elimination did (or,
+            # on the first pass, as the single initial branch), so there is
+            # nothing to eliminate
+            if changed:
+                self._eliminate_subsumed_branches()
+        
+        # Determine final satisfiability: every pass, the last included,
+        # returns above unless some branch is open, and subsumption only
+        # removes open branches that another open branch subsumes
+        self._satisfiable = True
+        
+        # Record completion (listing the open branches only when tracking)
+        if self.track_construction:
             open_branches = [i for i, b in enumerate(self.branches) if not b.is_closed]
             self._record_step('completion', f'Construction complete - formula is satisfiable (open branches: {open_branches})')
-        else:
-            self._record_step('completion', 'Construction complete - formula is unsatisfiable')
     
     def _find_applicable_rules(self, branch: TableauBranch) -> List[Tuple[Any, TableauRule]]:
         """
         Find all applicable rules for formulas in the branch.
         Returns list of (signed_formula, rule) pairs.
         """
-        applicable = []
+        return list(self._iter_applicable_rules(branch))
+    
+    def _iter_applicable_rules(self, branch: TableauBranch):
+        """Yield the (signed_formula, rule) pairs applicable on the branch."""
+        for sf in branch.signed_formulas:
+            if not branch.is_processed(sf):
+                for rule in self._rules_for(sf)[0]:
+                    yield sf, rule
+    
+    def _rules_for(self, signed_formula: Any) -> Tuple[Tuple[TableauRule, ...], Optional[Tuple[Tuple[int, str], TableauRule]]]:
+        """
+        The rules for a signed formula, with the first of highest priority.
+        
+        Returns (rules, best), best being the (priority key, rule) pair
+        build_tableau would pick among them, or None if there are no rules.
+        Both are looked up by (sign, formula class) in a table filled on
+        first use, so the rule key and rule priorities are only worked out
+        once per kind of signed formula rather than for every formula on
+        every pass.
+        """
+        kind = (signed_formula.sign, type(signed_formula.formula))
+        entry = self._rules_by_kind.get(kind)
+        if entry is None:
+            rules = tuple(self.rules.get(self._get_rule_key(signed_formula), ()))
+            # min() keeps the first of equal keys, as a stable sort would
+            best = min((((rule.priority, rule.rule_type), rule) for rule in rules),
+                       key=lambda pair: pair[0], default=None)
+            entry = self._rules_by_kind[kind] = (rules, best)
+        return entry
+    
+    def _select_rule(self, branch: TableauBranch) -> Optional[Tuple[Any, TableauRule]]:
+        """
+        The (signed_formula, rule) pair to apply next on the branch, if any.
+        
+        The same choice as sorting _find_applicable_rules() by priority
+        (α-rules first) and taking the first pair, made in one pass that
+        stops at the first pair no rule of the engine could beat.
+        """
+        selected = None
+        selected_key = None
         
         for sf in branch.signed_formulas:
             if branch.is_processed(sf):
                 continue
-                
-            # Determine rule key based on signed formula structure
-            rule_key = self._get_rule_key(sf)
-            
-            if rule_key in self.rules:
-                for rule in self.rules[rule_key]:
-                    applicable.append((sf, rule))
+            best = self._rules_for(sf)[1]
+            if best is not None and (selected is None or best[0] < selected_key):
+                selected_key, rule = best
+                selected = (sf, rule)
+                if selected_key == self._best_rule_key:
+                    break
         
-        return applicable
+        return selected
     
     def _get_rule_key(self, signed_formula: Any) -> str:
         """
@@ -2511,41 +2873,38 @@ class OptimizedTableauEngine:
         Format: "{sign}_{formula_type}"
         Examples: "T_conjunction", "F_disjunction", "M_implication"
         """
-        sign_str = str(signed_formula.sign)
+        formula = signed_formula.formula
+        
+        for cls in type(formula).__mro__:
+            kind = _RULE_FORMULA_KINDS.get(cls)
+            if kind is not None:
+                return f"{signed_formula.sign}_{kind}"
         
-        if hasattr(signed_formula.formula, 'name'):
+        if hasattr(formula, 'name'):
             # Atomic formula - no expansion rules
             return "atomic"
-        elif isinstance(signed_formula.formula, Conjunction):
-            return f"{sign_str}_conjunction"
-        elif isinstance(signed_formula.formula, Disjunction):
-            return f"{sign_str}_disjunction"
-        elif isinstance(signed_formula.formula, Implication):
-            return f"{sign_str}_implication"
-        elif isinstance(signed_formula.formula, Negation):
-            return f"{sign_str}_negation"
-        else:
-            return "unknown"
+        return "unknown"
     
     def _apply_rule(self, branch: TableauBranch, signed_formula: Any, rule: TableauRule) -> List[TableauBranch]:
         """
         Apply tableau rule to branch, returning resulting branches.
         
-        For α-rules: Returns single branch with new formulas added
+        For α-rules: Returns the branch itself with new formulas added
         For β-rules: Returns multiple branches, one for each conclusion
         """
         if rule.rule_type == "alpha":
-            # α-rule: Add all conclusions to the same branch
-            new_branch = branch.copy(parent_branch=branch.parent_branch, branch_id=branch.branch_id)
-            new_formulas = self._instantiate_rule_conclusions(signed_formula, rule.conclusions[0])
-            new_branch.add_formulas(new_formulas)
-            return [new_branch]
+            # α-rule: Add all conclusions to the same branch. The branch is
+            # replaced by its extension in the tableau, so it is extended in
+            # place rather than copied; the tree keeps pointing at it.
+            new_formulas = self._instantiate_rule_conclusions(signed_formula, rule.compiled_conclusions[0])
+            branch.add_formulas(new_formulas)
+            return [branch]
         
         else:  # β-rule
             # β-rule: Create separate branch for each conclusion
             result_branches = []
             
-            for i, conclusion_set in enumerate(rule.conclusions):
+            for conclusion_set in rule.compiled_conclusions:
                 branch_id = self.next_branch_id
                 self.next_branch_id += 1
                 
@@ -2559,70 +2918,30 @@ class OptimizedTableauEngine:
             
             return result_branches
     
-    def _instantiate_rule_conclusions(self, signed_formula: Any, conclusion_templates: List[str]) -> List[Any]:
+    def _instantiate_rule_conclusions(self, signed_formula: Any, 
+                                      compiled_conclusion: Tuple[Tuple[Any, int], ...]) -> Tuple[Any, ...]:
         """
-        Convert rule conclusion templates into actual signed formulas.
+        Convert a precompiled rule conclusion into actual signed formulas.
         
-        Templates use A, B, etc. as placeholders that get replaced with
-        actual subformulas from the input signed_formula.
-        """
-        new_formulas = []
+        Each (sign, slot) pair selects a subformula of the input signed_formula
+        (slot 0 for A, slot 1 for B) and signs it with the precompiled sign.
         
-        # Extract subformulas from the input
-        formula = signed_formula.formula
-        subformulas = {}
-        
-        if isinstance(formula, Conjunction):
-            subformulas['A'] = formula.left
-            subformulas['B'] = formula.right
-        elif isinstance(formula, Disjunction):
-            subformulas['A'] = formula.left  
-            subformulas['B'] = formula.right
-        elif isinstance(formula, Implication):
-            subformulas['A'] = formula.antecedent
-            subformulas['B'] = formula.consequent
-        elif isinstance(formula, Negation):
-            subformulas['A'] = formula.operand
-        
-        # Instantiate each conclusion template
-        for template in conclusion_templates:
-            if ':' in template:
-                sign_str, formula_template = template.split(':', 1)
-                
-                # Replace template variables with actual formulas
-                if formula_template == 'A' and 'A' in subformulas:
-                    target_formula = subformulas['A']
-                elif formula_template == 'B' and 'B' in subformulas:
-                    target_formula = subformulas['B']
-                else:
-                    continue  # Skip invalid templates
-                
-                # Create appropriate sign for the logic system
-                if self.sign_system == "classical":
-                    if sign_str == 'T':
-                        sign = ClassicalSign('T')
-                    elif sign_str == 'F':
-                        sign = ClassicalSign('F')
-                    else:
-                        continue  # Skip invalid signs
-                elif self.sign_system in ["wk3", "three_valued"]:
-                    if sign_str in ['T', 'F', 'U']:
-                        sign = ThreeValuedSign(sign_str)
-                    else:
-                        continue  # Skip invalid signs
-                elif self.sign_system == "wkrq":
-                    if sign_str in ['T', 'F', 'M', 'N']:
-                        sign = WkrqSign(sign_str)
-                    else:
-                        continue  # Skip invalid signs
-                else:
-                    continue  # Skip unknown system
-                
-                # Create new signed formula
-                new_sf = create_signed_formula(sign, target_formula)
-                new_formulas.append(new_sf)
-        
-        return new_formulas
+        The same signed formula is typically expanded on many branches (every
+        branch a β-rule splits inherits its unexpanded formulas), so
+        conclusions are cached per (signed formula, conclusion). The cache
+        is cleared at the start of every build, so a long-lived engine
+        holds on to no formulas from earlier tableaux.
+        """
+        key = (signed_formula, compiled_conclusion)
+        conclusions = self._conclusion_cache.get(key)
+        if conclusions is None:
+            # The rule was looked up by the formula's connective, so its
+            # subformulas need no second type check
+            subformulas = signed_formula.formula._components()
+            conclusions = self._conclusion_cache[key] = tuple(
+                SignedFormula(sign, subformulas[slot])
+                for sign, slot in compiled_conclusion if slot < len(subformulas))
+        return conclusions
     
     def _eliminate_subsumed_branches(self):
         """
@@ -2633,38 +2952,53 @@ class OptimizedTableauEngine:
         
         Reference: Fitting, M. (1996). First-Order Logic and Automated Theorem Proving.
         """
-        non_subsumed = []
-        
-        for i, branch1 in enumerate(self.branches):
-            if branch1.is_closed:
-                non_subsumed.append(branch1)
-                continue
-                
-            is_subsumed = False
-            
-            for j, branch2 in enumerate(self.branches):
-                if i == j or branch2.is_closed:
-                    continue
-                
-                # Check if branch2 subsumes branch1
-                if self._branch_subsumes(branch2, branch1):
-                    is_subsumed = True
-                    self.stats['subsumptions_eliminated'] += 1
-                    break
-            
-            if not is_subsumed:
-                non_subsumed.append(branch1)
-        
-        self.branches = non_subsumed
+        # A branch can only be subsumed by one with no more formulas, so
+        # visiting open branches smallest first means each candidate need
+        # only be tested against the branches kept so far: if a subsumer
+        # was itself eliminated, whatever subsumed it subsumes the
+        # candidate too. Of several identical branches the first is kept.
+        open_branches = sorted((branch for branch in self.branches if not branch.is_closed),
+                               key=lambda branch: len(branch.formula_set))
+        # Kept branches are indexed by one of their formulas (the newest,
+        # which siblings are least likely to share); a branch can only
+        # subsume a candidate containing that formula, so the candidate's
+        # own formulas find every kept branch worth testing
+        kept_by_witness = defaultdict(list)
+        subsumed = set()
+        
+        for candidate in open_branches:
+            if any(self._branch_subsumes(branch, candidate)
+                   for key in (None, *candidate.signed_formulas)
+                   for branch in kept_by_witness.get(key, ())):
+                subsumed.add(id(candidate))
+                self.stats['subsumptions_eliminated'] += 1
+            else:
+                witness = candidate.signed_formulas[-1] if candidate.signed_formulas else None
+                kept_by_witness[witness].append(candidate)
+        
+        if subsumed:
+            self.branches = [branch for branch in self.branches if id(branch) not in subsumed]
     
     def _branch_subsumes(self, subsumer: TableauBranch, subsumed: TableauBranch) -> bool:
         """Check if subsumer branch subsumes subsumed branch."""
-        # Convert to sets for efficient subset checking
-        subsumer_formulas = set(str(sf) for sf in subsumer.signed_formulas)
-        subsumed_formulas = set(str(sf) for sf in subsumed.signed_formulas)
+        # Each branch keeps its formulas as a set already; signed formulas
+        # compare structurally with cached hashes, so no strings are built
+        return subsumer.formula_set <= subsumed.formula_set
+    
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Construction statistics together with the final branch counts.
         
-        # subsumer subsumes subsumed if subsumer is a subset of subsumed
-        return subsumer_formulas.issubset(subsumed_formulas)
+        The tableau doesn't change once built, so the snapshot is computed
+        on first request and reused until the next build_tableau().
+        """
+        if self._statistics is None:
+            closed = self.stats['branches_closed']
+            self._statistics = dict(self.stats,
+                                    total_branches=len(self.branches),
+                                    open_branches=len(self.branches) - closed,
+                                    closed_branches=closed)
+        return dict(self._statistics)
     
     def build(self) -> bool:
         """Return satisfiability result."""
@@ -2681,64 +3015,58 @@ class OptimizedTableauEngine:
         For each open branch, construct a model that satisfies all atomic formulas
         on that branch. Uses completion procedure to assign truth values to
         atoms not mentioned in the branch.
+        
+        The tableau doesn't change once built and models are immutable, so
+        they are extracted on first request and reused (as a fresh list)
+        until the next build_tableau().
+        """
+        if self._models is None:
+            self._models = tuple(self.iter_models())
+        return list(self._models)
+    
+    def iter_models(self):
+        """
+        Lazily yield satisfying models from open branches.
+        
+        Same models, in the same order, as extract_all_models(), but each
+        model is only built when requested. Callers that need the first
+        model, a bounded number of models, or just a count don't
+        materialize the whole list.
         """
+        if self._models is not None:
+            yield from self._models
+            return
+        
         # Import dynamically to avoid circular imports
         from .unified_model import ClassicalModel, weakKleeneModel, WkrqModel
         
         if not self.is_satisfiable():
-            return []
+            return
         
-        models = []
+        # The sign system is fixed for the engine, so the model class and
+        # the conversion from sign to atom value are chosen once here
+        # rather than for every signed formula
+        if self.sign_system == "classical":
+            model_class, value_of = ClassicalModel, lambda sign: str(sign) == "T"
+        elif self.sign_system in ["wk3", "three_valued"]:
+            # "U" or undefined signs make the atom e
+            wk3_values = {"T": t, "F": f}
+            model_class, value_of = weakKleeneModel, lambda sign: wk3_values.get(str(sign), e)
+        elif self.sign_system == "wkrq":
+            model_class, value_of = WkrqModel, str
+        else:
+            return
         
         for branch in self.branches:
             if branch.is_closed:
                 continue
-                
-            # Extract atomic assignments from branch
-            assignments = {}
-            
-            for sf in branch.signed_formulas:
-                if hasattr(sf.formula, 'name'):  # Atomic formula
-                    atom_name = sf.formula.name
-                    
-                    if self.sign_system == "classical":
-                        assignments[atom_name] = str(sf.sign) == "T"
-                    elif self.sign_system in ["wk3", "three_valued"]:
-                        sign_str = str(sf.sign)
-                        if sign_str == "T":
-                            assignments[atom_name] = t
-                        elif sign_str == "F":
-                            assignments[atom_name] = f
-                        else:  # "U" or undefined
-                            assignments[atom_name] = e
-                    elif self.sign_system == "wkrq":
-                        assignments[atom_name] = str(sf.sign)
-                
-                elif hasattr(sf.formula, 'predicate_name'):  # Predicate formula
-                    # For predicates, use simplified key-based assignment
-                    pred_key = f"{sf.formula.predicate_name}"
-                    if self.sign_system == "classical":
-                        assignments[pred_key] = str(sf.sign) == "T"
-                    elif self.sign_system in ["wk3", "three_valued"]:
-                        sign_str = str(sf.sign)
-                        if sign_str == "T":
-                            assignments[pred_key] = t
-                        elif sign_str == "F":
-                            assignments[pred_key] = f
-                        else:
-                            assignments[pred_key] = e
-                    elif self.sign_system == "wkrq":
-                        assignments[pred_key] = str(sf.sign)
             
-            # Create appropriate model
-            if self.sign_system == "classical":
-                models.append(ClassicalModel(assignments))
-            elif self.sign_system in ["wk3", "three_valued"]:
-                models.append(weakKleeneModel(assignments))
-            elif self.sign_system == "wkrq":
-                models.append(WkrqModel(assignments))
-        
-        return models
+            # Extract atomic assignments from branch. Atoms and predicates
+            # are the atomic formulas; a predicate's name is its predicate
+            # name, giving the simplified key-based assignment used for
+            # predicates
+            yield model_class({sf.formula.name: value_of(sf.sign)
+                               for sf in branch.signed_formulas if sf.formula.is_atomic()})
 
 # Use OptimizedTableauEngine as the implementation
 SimpleTableauEngine = OptimizedTableauEngine
@@ -2747,9 +3075,6 @@ SimpleTableauEngine = OptimizedTableauEngine
 # MODE-AWARE SYSTEM (UNIFIED IMPLEMENTATION)
 # =============================================================================
 
-from enum import Enum
-from typing import Union
-
 class LogicMode(Enum):
     """
     Enumeration of supported logical modes for mode-aware tableau construction.
@@ -2884,43 +3209,60 @@ class FirstOrderBuilder:
         """Create a negation formula"""
         return Negation(operand)
 
+# Logic mode of the leaves of a formula. Connectives take the mode of
+# their operands; any other leaf (e.g. a quantified formula) counts as
+# propositional.
+_LEAF_MODES = {
+    Atom: LogicMode.PROPOSITIONAL,
+    Predicate: LogicMode.FIRST_ORDER,
+    Variable: LogicMode.FIRST_ORDER,
+    Constant: LogicMode.FIRST_ORDER,
+}
+
 def _detect_formula_mode(formula: Formula) -> LogicMode:
     """
     Automatically detect the logical mode of a formula.
     
-    Recursively analyzes the formula structure to determine whether it
-    contains first-order constructs (predicates, variables, constants)
-    or is purely propositional (only atoms and connectives).
-    """
-    if isinstance(formula, Atom):
-        return LogicMode.PROPOSITIONAL
-    elif isinstance(formula, Predicate):
-        return LogicMode.FIRST_ORDER
-    elif isinstance(formula, (Variable, Constant)):
-        return LogicMode.FIRST_ORDER
-    elif isinstance(formula, Negation):
-        return _detect_formula_mode(formula.operand)
-    elif isinstance(formula, (Conjunction, Disjunction)):
-        left_mode = _detect_formula_mode(formula.left)
-        right_mode = _detect_formula_mode(formula.right)
-        
-        # Check for mode mixing
-        if left_mode != right_mode:
-            raise ModeError(f"Mixed modes detected: {left_mode} and {right_mode}")
-        
-        return left_mode
-    elif isinstance(formula, Implication):
-        ant_mode = _detect_formula_mode(formula.antecedent)
-        cons_mode = _detect_formula_mode(formula.consequent)
+    Analyzes the formula structure to determine whether it contains
+    first-order constructs (predicates, variables, constants) or is
+    purely propositional (only atoms and connectives). Leaves are looked
+    up by class, exact type first, and connectives are stepped into
+    through their components. The walk uses an explicit stack and visits
+    each distinct subformula once, so neither deep formulas nor heavily
+    shared ones are a problem.
+    
+    Raises:
+        ModeError: If the formula has leaves of both modes
+    """
+    detected = None
+    stack = [formula]
+    visited = set()
+    
+    while stack:
+        node = stack.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        
+        for cls in type(node).__mro__:
+            mode = _LEAF_MODES.get(cls)
+            if mode is not None:
+                break
+        else:
+            components = node._components() if isinstance(node, Formula) else ()
+            if components:
+                # Reversed, so leaves are met left to right
+                stack.extend(reversed(components))
+                continue
+            mode = LogicMode.PROPOSITIONAL
         
         # Check for mode mixing
-        if ant_mode != cons_mode:
-            raise ModeError(f"Mixed modes detected: {ant_mode} and {cons_mode}")
-        
-        return ant_mode
-    else:
-        # For complex formulas or unknown types, assume propositional
-        return LogicMode.PROPOSITIONAL
+        if detected is None:
+            detected = mode
+        elif mode != detected:
+            raise ModeError(f"Mixed modes detected: {detected} and {mode}")
+    
+    return detected
 
 def propositional_tableau(formula: Formula) -> OptimizedTableauEngine:
     """
@@ -7,12 +7,164 @@ All tableau systems will return models that implement the same interface.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Union, Optional, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Union, Optional, Any
 from dataclasses import dataclass
 
-from .tableau_core import TruthValue, t, f, e, weakKleeneOperators, Formula, Atom, Negation, Conjunction, Disjunction, Implication
+from .tableau_core import TruthValue, t, f, e, Formula, Atom, Negation, Conjunction, Disjunction, Implication
+from .tableau_core import _WK3_NEGATION, _WK3_CONJUNCTION, _WK3_DISJUNCTION, _WK3_IMPLICATION
 
 
+# wKrQ values coded as small ints so connectives are tuple lookups.
+# Code 4 stands for an unrecognized assignment string; like the other
+# non-T/F values it negates and conjoins to M.
+_WKRQ_CODES = {'T': 0, 'F': 1, 'M': 2, 'N': 3}
+_WKRQ_VALUES = ('T', 'F', 'M', 'N', 'M')
+_WKRQ_NEGATION = (1, 0, 3, 2, 2)  # T->F, F->T, M->N, N->M
+_WKRQ_CONJUNCTION = tuple(
+    tuple(0 if a == b == 0 else 1 if 1 in (a, b) else 2 for b in range(5))
+    for a in range(5)
+)
+
+
+def _lookup_handler(handlers, formula):
+    """
+    Find the handler for a formula in a table keyed by connective class.
+    
+    The exact type hits on the first probe and subclasses of a connective
+    fall back to their base classes.
+    """
+    for cls in type(formula).__mro__:
+        handler = handlers.get(cls)
+        if handler is not None:
+            return handler
+    raise ValueError(f"Unknown formula type: {type(formula)}")
+
+
+@lru_cache(maxsize=256)
+def _linearize(formula):
+    """
+    Flatten a formula into its distinct subformulas in post order.
+    
+    Returns a tuple of (subformula, operand_indices) pairs, where the indices
+    point at earlier entries, so a single forward pass sees every operand
+    before its parent. The last entry is the formula itself. Shared
+    subformulas appear once, and the tree is walked with an explicit stack,
+    so depth costs no recursion. Formulas without components (see
+    Formula._components) are leaves.
+    """
+    index = {}
+    program = []
+    stack = [(formula, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if node in index:
+            continue
+        operand_nodes = node._components()
+        if operand_nodes and not expanded:
+            # Visit again once every operand has an index
+            stack.append((node, True))
+            stack.extend((operand, False) for operand in reversed(operand_nodes))
+            continue
+        index[node] = len(program)
+        program.append((node, tuple(index[operand] for operand in operand_nodes)))
+    return tuple(program)
+
+
+def _compile_formula_source(formula, atom_template, connectives):
+    """
+    Generate straight-line Python source that evaluates formula.
+    
+    The generated function takes a model's assignments.get and computes
+    each entry of the formula's linearized program (see _linearize) once,
+    as a local variable.
+    
+    Args:
+        formula: Compound formula to compile
+        atom_template: Expression for an atom's value, with {name} the
+            repr of the atom name
+        connectives: Handler table (see _lookup_handler) of expression
+            templates with one positional field per operand
+    """
+    lines = ["def evaluate(get):"]
+    for i, (node, operands) in enumerate(_linearize(formula)):
+        if isinstance(node, Atom):
+            expression = atom_template.format(name=repr(node.name))
+        else:
+            template = _lookup_handler(connectives, node)
+            expression = template.format(*(f"v{j}" for j in operands))
+        lines.append(f"    v{i} = {expression}")
+    lines.append(f"    return v{i}")
+    return "\n".join(lines)
+
+
+# How each logic compiles atoms and connectives, plus the names the
+# generated code may refer to
+_CLASSICAL_PROGRAM = ("get({name}, False)", {
+    Negation: "not {0}",
+    Conjunction: "{0} and {1}",
+    Disjunction: "{0} or {1}",
+    Implication: "not {0} or {1}",
+}, {})
+
+_WK3_PROGRAM = ("get({name}, e)", {
+    Negation: "NEG[{0}._tag]",
+    Conjunction: "CONJ[{0}._tag * 3 + {1}._tag]",
+    Disjunction: "DISJ[{0}._tag * 3 + {1}._tag]",
+    Implication: "IMPL[{0}._tag * 3 + {1}._tag]",
+}, {
+    'e': e,
+    'NEG': _WK3_NEGATION,
+    'CONJ': _WK3_CONJUNCTION,
+    'DISJ': _WK3_DISJUNCTION,
+    'IMPL': _WK3_IMPLICATION,
+})
+
+# Simplified wKrQ semantics on value codes: conjunction and negation only,
+# anything else M
+_WKRQ_PROGRAM = ("CODES.get(get({name}, 'M'), 4)", {
+    Negation: "NEG[{0}]",
+    Conjunction: "CONJ[{0}][{1}]",
+    object: "2",
+}, {
+    'CODES': _WKRQ_CODES,
+    'NEG': _WKRQ_NEGATION,
+    'CONJ': _WKRQ_CONJUNCTION,
+})
+
+_PROGRAMS = {
+    'classical': _CLASSICAL_PROGRAM,
+    'wk3': _WK3_PROGRAM,
+    'wkrq': _WKRQ_PROGRAM,
+}
+
+
+@lru_cache(maxsize=256)
+def _compiled_formula(formula, logic):
+    """
+    Compiled evaluator for a compound formula in the given logic.
+    
+    Compilation costs more than one interpreted evaluation, so results are
+    cached: evaluating a formula against many models compiles it once.
+    """
+    atom_template, connectives, namespace = _PROGRAMS[logic]
+    source = _compile_formula_source(formula, atom_template, connectives)
+    namespace = dict(namespace)
+    exec(compile(source, f"<{logic} formula>", "exec"), namespace)
+    return namespace['evaluate']
+
+
+def _classical_value(value: Any) -> Optional[bool]:
+    """Convert a non-bool assignment value for a classical model"""
+    if isinstance(value, TruthValue):
+        # Tag lookup on the interned value; e has no classical value (None)
+        return value.to_bool()
+    elif hasattr(value, 'value'):
+        # Handle objects with .value attribute
+        return bool(value.value)
+    return bool(value)
+
 
 class UnifiedModel(ABC):
     """Abstract base class for all model types across different logic systems"""
@@ -43,17 +195,49 @@ class UnifiedModel(ABC):
     
     @property
     @abstractmethod
-    def assignments(self) -> Dict[str, Union[bool, TruthValue]]:
-        """Get all atom assignments as a dictionary"""
+    def assignments(self) -> Mapping[str, Union[bool, TruthValue]]:
+        """Get all atom assignments as a mapping"""
         pass
     
+    def copy_assignments(self) -> Dict[str, Union[bool, TruthValue]]:
+        """Get a mutable copy of all atom assignments"""
+        return dict(self.assignments)
+    
     @abstractmethod
     def __str__(self) -> str:
         """String representation of the model"""
         pass
+    
+    def _format_assignments(self, format_value=str) -> str:
+        """
+        Render the assignments as {atom=value, ...} in atom order.
+        
+        A model's assignments are fixed at construction, so the text is
+        built in a single pass on first use and cached.
+        """
+        try:
+            return self._str
+        except AttributeError:
+            self._str = "{" + ", ".join(f"{atom}={format_value(value)}"
+                                        for atom, value in sorted(self._assignments.items())) + "}"
+            return self._str
+    
+    def __eq__(self, other) -> bool:
+        """Models are equal when they are the same kind and assign alike"""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._assignments == other._assignments
+    
+    def __hash__(self) -> int:
+        """Order-independent hash of the assignments, computed once"""
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self._assignments.items()))
+            return self._hash
 
 
-@dataclass
+@dataclass(eq=False)
 class ClassicalModel(UnifiedModel):
     """Unified model for classical two-valued logic"""
     
@@ -61,18 +245,10 @@ class ClassicalModel(UnifiedModel):
     
     def __init__(self, assignments: Dict[str, Union[bool, TruthValue]]):
         """Initialize with flexible input types"""
-        self._assignments = {}
-        for atom, value in assignments.items():
-            if isinstance(value, bool):
-                self._assignments[atom] = value
-            elif isinstance(value, TruthValue):
-                # Convert TruthValue to bool for classical logic
-                self._assignments[atom] = value.to_bool()
-            elif hasattr(value, 'value'):
-                # Handle objects with .value attribute
-                self._assignments[atom] = bool(value.value)
-            else:
-                self._assignments[atom] = bool(value)
+        # Tableau models pass plain bools, which are kept in one
+        # comprehension; anything else goes through _classical_value
+        self._assignments = {atom: value if value.__class__ is bool else _classical_value(value)
+                             for atom, value in assignments.items()}
     
     def satisfies(self, formula: Formula) -> bool:
         """Evaluate formula under classical semantics"""
@@ -87,41 +263,24 @@ class ClassicalModel(UnifiedModel):
         return self._assignments.get(atom_name, False)
     
     @property
-    def assignments(self) -> Dict[str, bool]:
-        """Get all assignments"""
-        return self._assignments.copy()
+    def assignments(self) -> Mapping[str, bool]:
+        """Read-only view of all assignments; use copy_assignments() to modify"""
+        return MappingProxyType(self._assignments)
     
     def _evaluate_classical(self, formula) -> bool:
         """Evaluate formula using classical truth conditions"""
         if isinstance(formula, Atom):
             return self._assignments.get(formula.name, False)
-        elif isinstance(formula, Negation):
-            return not self._evaluate_classical(formula.operand)
-        elif isinstance(formula, Conjunction):
-            return (self._evaluate_classical(formula.left) and 
-                   self._evaluate_classical(formula.right))
-        elif isinstance(formula, Disjunction):
-            return (self._evaluate_classical(formula.left) or 
-                   self._evaluate_classical(formula.right))
-        elif isinstance(formula, Implication):
-            return (not self._evaluate_classical(formula.antecedent) or 
-                   self._evaluate_classical(formula.consequent))
-        else:
-            raise ValueError(f"Unknown formula type: {type(formula)}")
+        return _compiled_formula(formula, 'classical')(self._assignments.get)
     
     def __str__(self) -> str:
-        if not self._assignments:
-            return "{}"
-        
-        sorted_items = sorted(self._assignments.items())
-        assignment_strs = [f"{atom}={str(value).lower()}" for atom, value in sorted_items]
-        return "{" + ", ".join(assignment_strs) + "}"
+        return self._format_assignments(lambda value: str(value).lower())
     
     def __repr__(self) -> str:
         return f"ClassicalModel({self._assignments})"
 
 
-@dataclass  
+@dataclass(eq=False)
 class weakKleeneModel(UnifiedModel):
     """Unified model for weak Kleene three-valued logic"""
     
@@ -146,52 +305,45 @@ class weakKleeneModel(UnifiedModel):
     
     def is_satisfying(self, formula: Formula) -> bool:
         """Check if model classically satisfies formula (evaluates to t)"""
-        return self._evaluate_wk3(formula) == t
+        return self._evaluate_wk3(formula) is t
     
     def get_assignment(self, atom_name: str) -> TruthValue:
         """Get truth value assignment for atom"""
         return self._assignments.get(atom_name, e)
     
     @property
-    def assignments(self) -> Dict[str, TruthValue]:
-        """Get all assignments"""
-        return self._assignments.copy()
+    def assignments(self) -> Mapping[str, TruthValue]:
+        """Read-only view of all assignments; use copy_assignments() to modify"""
+        return MappingProxyType(self._assignments)
+    
+    @staticmethod
+    def batch_satisfies(models: Iterable['weakKleeneModel'], formula: Formula) -> List[TruthValue]:
+        """
+        Evaluate one formula in many models.
+        
+        The formula is compiled once and the compiled evaluator is applied
+        to each model in turn, so a whole truth table costs one compilation.
+        
+        Returns:
+            The formula's truth value in each model, in order
+        """
+        evaluate = _compiled_formula(formula, 'wk3')
+        return [evaluate(model._assignments.get) for model in models]
     
     def _evaluate_wk3(self, formula) -> TruthValue:
         """Evaluate formula using weak Kleene semantics"""
         if isinstance(formula, Atom):
             return self._assignments.get(formula.name, e)
-        elif isinstance(formula, Negation):
-            operand_value = self._evaluate_wk3(formula.operand)
-            return weakKleeneOperators.negation(operand_value)
-        elif isinstance(formula, Conjunction):
-            left_value = self._evaluate_wk3(formula.left)
-            right_value = self._evaluate_wk3(formula.right)
-            return weakKleeneOperators.conjunction(left_value, right_value)
-        elif isinstance(formula, Disjunction):
-            left_value = self._evaluate_wk3(formula.left)  
-            right_value = self._evaluate_wk3(formula.right)
-            return weakKleeneOperators.disjunction(left_value, right_value)
-        elif isinstance(formula, Implication):
-            antecedent_value = self._evaluate_wk3(formula.antecedent)
-            consequent_value = self._evaluate_wk3(formula.consequent)
-            return weakKleeneOperators.implication(antecedent_value, consequent_value)
-        else:
-            raise ValueError(f"Unknown formula type: {type(formula)}")
+        return _compiled_formula(formula, 'wk3')(self._assignments.get)
     
     def __str__(self) -> str:
-        if not self._assignments:
-            return "{}"
-        
-        sorted_items = sorted(self._assignments.items())
-        assignment_strs = [f"{atom}={value}" for atom, value in sorted_items]
-        return "{" + ", ".join(assignment_strs) + "}"
+        return self._format_assignments()
     
     def __repr__(self) -> str:
         return f"weakKleeneModel({self._assignments})"
 
 
-@dataclass
+@dataclass(eq=False)
 class WkrqModel(UnifiedModel):
     """Unified model for wKrQ four-valued logic"""
     
@@ -213,48 +365,33 @@ class WkrqModel(UnifiedModel):
     
     def is_satisfying(self, formula: Formula) -> bool:
         """Check if model classically satisfies formula (evaluates to T)"""
-        return self._evaluate_wkrq(formula) == 'T'
+        # Compare in the code domain; no need to decode back to a string
+        return self._evaluate_wkrq_code(formula) == 0
     
     def get_assignment(self, atom_name: str) -> str:
         """Get epistemic value assignment for atom"""
         return self._assignments.get(atom_name, 'M')  # Default to "may be true"
     
     @property
-    def assignments(self) -> Dict[str, str]:
-        """Get all assignments"""
-        return self._assignments.copy()
+    def assignments(self) -> Mapping[str, str]:
+        """Read-only view of all assignments; use copy_assignments() to modify"""
+        return MappingProxyType(self._assignments)
     
     def _evaluate_wkrq(self, formula: Formula) -> str:
         """Evaluate formula using wKrQ epistemic semantics"""
-        # Simplified wKrQ evaluation - extend as needed
         if isinstance(formula, Atom):
             return self._assignments.get(formula.name, 'M')
-        elif isinstance(formula, Negation):
-            operand_value = self._evaluate_wkrq(formula.operand)
-            # Negation in wKrQ: T->F, F->T, M->N, N->M
-            negation_map = {'T': 'F', 'F': 'T', 'M': 'N', 'N': 'M'}
-            return negation_map.get(operand_value, 'M')
-        elif isinstance(formula, Conjunction):
-            left_value = self._evaluate_wkrq(formula.left)
-            right_value = self._evaluate_wkrq(formula.right)
-            # Simplified conjunction - proper wKrQ semantics would be more complex
-            if left_value == 'T' and right_value == 'T':
-                return 'T'
-            elif left_value == 'F' or right_value == 'F':
-                return 'F'
-            else:
-                return 'M'  # Default to "may be true"
-        # Add other operators as needed
-        else:
-            return 'M'  # Default for unknown cases
+        return _WKRQ_VALUES[self._evaluate_wkrq_code(formula)]
+    
+    def _evaluate_wkrq_code(self, formula: Formula) -> int:
+        """Evaluate formula to its wKrQ value code (see _WKRQ_CODES)"""
+        # Simplified wKrQ evaluation - extend _WKRQ_PROGRAM as needed
+        if isinstance(formula, Atom):
+            return _WKRQ_CODES.get(self._assignments.get(formula.name, 'M'), 4)
+        return _compiled_formula(formula, 'wkrq')(self._assignments.get)
     
     def __str__(self) -> str:
-        if not self._assignments:
-            return "{}"
-        
-        sorted_items = sorted(self._assignments.items())
-        assignment_strs = [f"{atom}={value}" for atom, value in sorted_items]
-        return "{" + ", ".join(assignment_strs) + "}"
+        return self._format_assignments()
     
     def __repr__(self) -> str:
         return f"WkrqModel({self._assignments})"
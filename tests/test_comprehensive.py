@@ -264,7 +264,22 @@ class TestWeakKleeneLogic:
         assert weakKleeneOperators.disjunction(f, t) == t
         assert weakKleeneOperators.disjunction(f, e) == e
         assert weakKleeneOperators.disjunction(e, e) == e
-    
+
+    def test_wk3_truth_value_identity(self):
+        """Test that WK3 operations return the shared TruthValue members"""
+        from tableaux import weakKleeneOperators
+        from tableaux.tableau_core import ThreeValuedSign, dual_sign
+
+        assert weakKleeneOperators.negation(t) is f
+        assert weakKleeneOperators.conjunction(t, e) is e
+        assert weakKleeneOperators.implication(f, e) is e
+        assert TruthValue.from_string("neither") is e
+        assert t.to_bool() is True and e.to_bool() is None
+
+        # Three-valued duals swap T/F and leave U fixed
+        assert dual_sign(ThreeValuedSign("T")) == ThreeValuedSign("F")
+        assert dual_sign(ThreeValuedSign("U")) == ThreeValuedSign("U")
+
     def test_wk3_model_evaluation(self):
         """Test WK3 model evaluation"""
         model = weakKleeneModel({"p": t, "q": f, "r": e})
@@ -289,6 +304,52 @@ class TestWeakKleeneLogic:
         assert model.satisfies(Disjunction(p, q)) == t  # t ∨ f = t
         assert model.satisfies(Disjunction(q, r)) == e  # f ∨ e = e
 
+    def test_model_evaluation_shared_subformulas(self):
+        """Test that shared subformulas are evaluated once per call"""
+        from tableaux.unified_model import ClassicalModel
+
+        p, q = Atom("p"), Atom("q")
+        # A DAG of depth 60 whose unfolded tree has 2^60 leaves
+        formula = Disjunction(p, q)
+        for _ in range(60):
+            formula = Conjunction(formula, formula)
+
+        assert weakKleeneModel({"p": t, "q": e}).satisfies(formula) == e
+        assert weakKleeneModel({"p": t, "q": f}).satisfies(formula) == t
+        assert ClassicalModel({"p": False, "q": True}).satisfies(formula) == True
+
+    def test_model_batch_satisfies(self):
+        """Test evaluating one formula across a whole truth table"""
+        p, q = Atom("p"), Atom("q")
+        formula = Implication(p, Negation(q))
+        models = [weakKleeneModel({"p": a, "q": b}) for a in (t, f, e) for b in (t, f, e)]
+
+        results = weakKleeneModel.batch_satisfies(models, formula)
+        assert results == [model.satisfies(formula) for model in models]
+        assert results == [f, t, e, t, t, e, e, e, e]
+        assert weakKleeneModel.batch_satisfies(models[:2], p) == [t, t]
+        assert weakKleeneModel.batch_satisfies([], formula) == []
+
+    def test_operator_tables_match_definitions(self):
+        """Test the weak Kleene tables against the truth conditions"""
+        from tableaux import weakKleeneOperators as ops
+
+        p, q = Atom("p"), Atom("q")
+        for a in (t, f, e):
+            assert ops.negation(a) is {t: f, f: t, e: e}[a]
+            for b in (t, f, e):
+                if e in (a, b):
+                    expected = (e, e, e)
+                else:
+                    expected = (TruthValue.from_bool(a is t and b is t),
+                                TruthValue.from_bool(a is t or b is t),
+                                TruthValue.from_bool(a is f or b is t))
+                assert (ops.conjunction(a, b), ops.disjunction(a, b),
+                        ops.implication(a, b)) == expected
+                model = weakKleeneModel({"p": a, "q": b})
+                assert (model.satisfies(Conjunction(p, q)), model.satisfies(Disjunction(p, q)),
+                        model.satisfies(Implication(p, q))) == expected
+
 
 class TestFirstOrderPredicateLogic:
     """Tests for first-order predicate logic extensions"""
@@ -367,6 +428,15 @@ class TestFirstOrderPredicateLogic:
         tableau = classical_signed_tableau(T(formula))
         assert tableau.build() == False
 
+    def test_closure_distinguishes_predicate_arguments(self):
+        """Test that closure compares predicates with their arguments"""
+        a, b = Constant("a"), Constant("b")
+        assert classical_signed_tableau([T(Predicate("P", [a])), F(Predicate("P", [b]))]).build() == True
+        assert classical_signed_tableau([T(Predicate("P", [a])), F(Predicate("P", [a]))]).build() == False
+
+        branch = classical_signed_tableau([T(Predicate("P", [a])), F(Predicate("P", [a]))]).branches[0]
+        assert branch.closure_reason == (T(Predicate("P", [a])), F(Predicate("P", [a])))
+
 
 class TestModeAwareSystem:
     """Tests for mode-aware logic system (propositional vs first-order)"""
@@ -427,6 +497,36 @@ class TestModeAwareSystem:
         with pytest.raises(ModeError):
             first_order_tableau(mixed)
 
+    def test_formula_mode_detection(self):
+        """Test mode detection through connectives and connective subclasses"""
+        from tableaux.tableau_core import _detect_formula_mode, LogicMode, ModeError
+
+        class MarkedNegation(Negation):
+            __slots__ = ()
+
+        p, q = Atom("p"), Atom("q")
+        pa = Predicate("P", [Constant("a")])
+        assert _detect_formula_mode(Implication(MarkedNegation(p), Disjunction(q, p))) == LogicMode.PROPOSITIONAL
+        assert _detect_formula_mode(MarkedNegation(Conjunction(pa, pa))) == LogicMode.FIRST_ORDER
+        with pytest.raises(ModeError):
+            _detect_formula_mode(Negation(Implication(pa, p)))
+
+    def test_formula_mode_detection_deep_and_shared(self):
+        """Test mode detection on very deep and on heavily shared formulas"""
+        from tableaux.tableau_core import _detect_formula_mode, LogicMode
+
+        p, q = Atom("p"), Atom("q")
+        deep = p
+        for i in range(5000):
+            deep = Disjunction(deep, Atom(f"a{i % 3}"))
+        assert _detect_formula_mode(deep) == LogicMode.PROPOSITIONAL
+
+        # Depth 60: the unfolded tree has 2^60 leaves
+        shared = Conjunction(Predicate("P", [Constant("a")]), Predicate("Q", [Constant("b")]))
+        for _ in range(60):
+            shared = Implication(shared, Negation(shared))
+        assert _detect_formula_mode(shared) == LogicMode.FIRST_ORDER
+
 
 # DEPRECATED: class TestComponentizedRuleSystem:
 # DEPRECATED:     """Tests for the new componentized rule system"""
@@ -538,7 +638,188 @@ class TestOptimizationsAndPerformance:
         # Should have eliminated subsumed branches
         # Exact branch count depends on implementation details
         assert len(tableau.branches) >= 1
-    
+
+    def test_branch_subsumption_is_structural(self):
+        """Test that subsumption compares signed formulas, not their strings"""
+        from tableaux.tableau_core import TableauBranch
+
+        p, q = Atom("p"), Atom("q")
+        engine = classical_signed_tableau(T(p))
+        small = TableauBranch([T(p)])
+        large = TableauBranch([T(p), F(q), T(Conjunction(p, q))])
+        assert engine._branch_subsumes(small, large)
+        assert not engine._branch_subsumes(large, small)
+        # An atom that prints like a compound formula is still a different formula
+        lookalike = TableauBranch([T(Atom("p")), T(Atom("(p ∧ q)"))])
+        assert not engine._branch_subsumes(TableauBranch([T(Conjunction(p, q))]), lookalike)
+
+    def test_identical_branches_not_both_eliminated(self):
+        """Test that of two identical open branches one survives subsumption"""
+        p, q = Atom("p"), Atom("q")
+
+        tableau = classical_signed_tableau(T(Disjunction(p, p)))
+        assert tableau.build() == True
+        assert len(tableau.branches) == 1
+        assert tableau.get_statistics()['subsumptions_eliminated'] == 1
+
+        # Smaller open branches subsume larger ones; branch order is kept
+        tableau = classical_signed_tableau(T(Disjunction(Conjunction(p, q), p)))
+        assert tableau.build() == True
+        assert [len(b.signed_formulas) for b in tableau.branches] == [2]
+
+    def test_subsumption_pass_on_crafted_branches(self):
+        """Test the indexed subsumption pass against the definition"""
+        from tableaux.tableau_core import TableauBranch
+
+        p, q, r, s_ = Atom("p"), Atom("q"), Atom("r"), Atom("s")
+        engine = classical_signed_tableau(T(p))
+        engine.stats['subsumptions_eliminated'] = 0
+        branches = [
+            TableauBranch([T(p), T(q), T(r)]),   # subsumed by [T(q), T(p)]
+            TableauBranch([T(q), T(p)]),
+            TableauBranch([T(r), T(s_)]),
+            TableauBranch([T(s_), T(r), F(q)]),  # subsumed by [T(r), T(s)]
+            TableauBranch([T(p), F(p)]),         # closed, never eliminated
+            TableauBranch([T(p), T(s_)]),
+        ]
+        engine.branches = branches[:]
+        engine._eliminate_subsumed_branches()
+        assert engine.branches == [branches[1], branches[2], branches[4], branches[5]]
+        assert engine.stats['subsumptions_eliminated'] == 2
+
+        empty = TableauBranch([])
+        engine.branches = [branches[1], empty]
+        engine._eliminate_subsumed_branches()
+        assert engine.branches == [empty]
+
+    def test_step_tracking_records_new_formulas(self):
+        """Test that rule steps list exactly the formulas each rule added"""
+        p, q = Atom("p"), Atom("q")
+
+        formula = T(Disjunction(Conjunction(p, q), Negation(p)))
+        tableau = classical_signed_tableau(formula)
+        tableau.enable_step_tracking()
+        tableau.reset([formula])
+        steps = [(s['new_formulas'], s['branch_index'])
+                 for s in tableau.get_step_by_step_construction() if s['step_type'] == 'rule_application']
+        assert steps == [(["T:p ∧ q", "T:¬p"], 0), (["T:p", "T:q"], 0), (["F:p"], 1)]
+
+    def test_rule_conclusions_precompiled(self):
+        """Test that rule templates are compiled to (sign, slot) pairs once"""
+        p, q = Atom("p"), Atom("q")
+
+        tableau = classical_signed_tableau(T(Implication(p, q)))
+        rule = tableau.rules['T_implication'][0]
+        assert rule.compiled_conclusions == [((F(p).sign, 0),), ((T(q).sign, 1),)]
+
+        # wKrQ-only signs compile for wKrQ and the U-rule keeps its first branch only
+        tableau = wkrq_signed_tableau(M(Conjunction(p, q)))
+        assert len(tableau.rules['M_conjunction'][0].compiled_conclusions) == 3
+        tableau = three_valued_signed_tableau(U(Conjunction(p, q)))
+        assert tableau.rules['U_conjunction'][0].compiled_conclusions[0] == ((U(p).sign, 0),)
+
+    def test_signed_formula_constructors_share_signs(self):
+        """Test that T/F/T3/U/M/... reuse one sign instance per designation"""
+        p, q = Atom("p"), Atom("q")
+        for constructor in (T, F, T3, F3, U, TF, FF, M, N):
+            assert constructor(p).sign is constructor(q).sign
+        assert T(p).sign is not T3(p).sign
+        assert not hasattr(T(p), '__dict__')
+
+    def test_signs_are_interned(self):
+        """Test that each sign class keeps one instance per designation"""
+        import copy
+        import pickle
+        from tableaux.tableau_core import ClassicalSign, ThreeValuedSign, WkrqSign
+
+        for cls, designations in ((ClassicalSign, "TF"), (ThreeValuedSign, "TFU"), (WkrqSign, "TFMN")):
+            for designation in designations:
+                sign = cls(designation)
+                assert cls(designation) is sign
+                assert pickle.loads(pickle.dumps(sign)) is sign
+                assert copy.deepcopy(sign) is sign
+                assert not hasattr(sign, '__dict__')
+        assert ClassicalSign("T") is not WkrqSign("T")
+        assert T(Atom("p")).sign is ClassicalSign("T")
+
+        with pytest.raises(ValueError):
+            ClassicalSign("U")
+        assert "U" not in ClassicalSign._instances
+
+    def test_truth_value_tags(self):
+        """Test that truth values are singletons with integer tags"""
+        assert [v._tag for v in (t, f, e)] == [0, 1, 2]
+        assert TruthValue('t') is t and TruthValue.from_string('e') is e
+        assert [v.to_bool() for v in (t, f, e)] == [True, False, None]
+        assert [v.is_classical() for v in (t, f, e)] == [True, True, False]
+
+    def test_duplicate_conclusions_not_reexpanded(self):
+        """Test that a shared subformula is added and expanded once per branch"""
+        p, q = Atom("p"), Atom("q")
+        shared = Conjunction(p, q)
+
+        tableau = classical_signed_tableau(T(Conjunction(shared, shared)))
+        assert tableau.build() == True
+
+        branch = tableau.branches[0]
+        assert branch.signed_formulas.count(T(shared)) == 1
+        assert branch.signed_formulas.count(T(p)) == 1
+        # Outer conjunction plus a single expansion of the shared conjunct
+        assert tableau.stats['rule_applications'] == 2
+
+    def test_branch_add_formulas_skips_known(self):
+        """Test that add_formulas keeps first occurrences in order"""
+        from tableaux.tableau_core import TableauBranch
+
+        p, q, r = Atom("p"), Atom("q"), Atom("r")
+        branch = TableauBranch([T(p)])
+        branch.add_formulas([T(q), T(p), F(r), T(q)])
+        assert branch.signed_formulas == [T(p), T(q), F(r)]
+        assert branch.formula_set == {T(p), T(q), F(r)}
+
+    def test_closure_reason_built_on_demand(self):
+        """Test that closure reasons are looked up only when read"""
+        from tableaux.tableau_core import TableauBranch
+
+        p, q = Atom("p"), Atom("q")
+        branch = TableauBranch([T(q), T(p)])
+        assert branch.closure_reason is None
+        branch.add_formulas([F(p)])
+        assert branch.is_closed and branch._closure_reason is None
+        assert branch.closure_reason == (T(p), F(p))
+        assert branch.copy().closure_reason is branch.closure_reason
+
+    def test_closure_tracked_incrementally(self):
+        """Test that added formulas update closure like a rebuilt branch"""
+        from tableaux.tableau_core import TableauBranch
+
+        p, q, r = Atom("p"), Atom("q"), Atom("r")
+        branch = TableauBranch([T(q), T(p), U(r)])
+        branch.add_formulas([F(r), T(Conjunction(p, q))])
+        assert not branch.is_closed
+
+        # Of two formulas closing at once, the first on the branch is reported
+        branch.add_formulas([F(p), F(q)])
+        rebuilt = TableauBranch(branch.signed_formulas)
+        assert branch.is_closed and rebuilt.is_closed
+        assert branch.formula_signs == rebuilt.formula_signs
+        assert branch.closure_reason == rebuilt.closure_reason == (T(q), F(q))
+
+    def test_branch_copy_is_independent(self):
+        """Test that a branch copy shares formulas but not containers"""
+        from tableaux.tableau_core import TableauBranch
+
+        p, q = Atom("p"), Atom("q")
+        parent = TableauBranch([T(p)], branch_id=3)
+        child = parent.copy(parent_branch=parent, branch_id=4)
+        assert (child.branch_id, child.depth, child.parent_branch) == (4, 1, parent)
+        assert child.child_branches == [] and not child.is_closed
+
+        child.add_formulas([F(p)])
+        assert child.is_closed and not parent.is_closed
+        assert parent.signed_formulas == [T(p)] and parent.formula_set == {T(p)}
+        assert child.signed_formulas[0] is parent.signed_formulas[0]
+
     def test_early_satisfiability_detection(self):
         """Test early detection of satisfiability"""
         p = Atom("p")
@@ -587,6 +868,216 @@ class TestOptimizationsAndPerformance:
         for model in models:
             assert model.satisfies(formula) == True
 
+    def test_iter_models_streams_same_models(self):
+        """Test that iter_models lazily yields the extract_all_models list"""
+        from types import GeneratorType
+
+        p, q, r = Atom("p"), Atom("q"), Atom("r")
+        tableau = classical_signed_tableau(T(Disjunction(Disjunction(p, q), r)))
+
+        models = tableau.iter_models()
+        assert isinstance(models, GeneratorType)
+        assert list(models) == tableau.extract_all_models()
+        assert next(tableau.iter_models()) == tableau.extract_all_models()[0]
+
+        unsat = classical_signed_tableau(T(Conjunction(p, Negation(p))))
+        assert list(unsat.iter_models()) == []
+
+    def test_atomic_input_fast_path(self):
+        """Test that all-atomic inputs skip the construction loop"""
+        p, q = Atom("p"), Atom("q")
+
+        tableau = classical_signed_tableau([T(p), F(q)])
+        assert tableau.build()
+        assert tableau.get_statistics()['fast_path_hit']
+        assert tableau.extract_all_models()[0].assignments == {"p": True, "q": False}
+
+        # Contradictory literals still close, and compound input takes the full loop
+        assert not classical_signed_tableau([T(p), F(p)]).build()
+        tableau = classical_signed_tableau(T(Conjunction(p, q)))
+        assert tableau.build()
+        assert not tableau.get_statistics()['fast_path_hit']
+
+    def test_rule_lookup_by_kind(self):
+        """Test rule lookup for connective subclasses and rule-less formulas"""
+        from tableaux.tableau_core import OptimizedTableauEngine
+
+        class MarkedNegation(Negation):
+            __slots__ = ()
+
+        p = Atom("p")
+        engine = OptimizedTableauEngine("classical")
+        assert engine._get_rule_key(T(MarkedNegation(p))) == "T_negation"
+        assert engine._get_rule_key(F(Implication(p, p))) == "F_implication"
+        assert engine._get_rule_key(T(p)) == "atomic"
+
+        assert not classical_signed_tableau(T(Conjunction(MarkedNegation(p), p))).build()
+        assert wkrq_signed_tableau(M(Conjunction(p, Negation(p)))).build()
+
+    def test_expansions_shared_between_branches(self):
+        """Test that a formula expanded on several branches is expanded once"""
+        p, q, r, s = Atom("p"), Atom("q"), Atom("r"), Atom("s")
+        tableau = classical_signed_tableau([T(Disjunction(p, q)), T(Disjunction(r, s))])
+        assert len(tableau.branches) == 4
+
+        for atom in (r, s):
+            copies = {id(sf) for branch in tableau.branches
+                      for sf in branch.signed_formulas if sf == T(atom)}
+            assert len(copies) == 1
+
+    def test_rule_tables_shared_between_engines(self):
+        """Test that engines share compiled rules but not rule tables"""
+        from tableaux.tableau_core import OptimizedTableauEngine, TableauRule
+
+        first, second = OptimizedTableauEngine("wkrq"), OptimizedTableauEngine("wkrq")
+        assert first.rules['M_conjunction'][0] is second.rules['M_conjunction'][0]
+        assert second.rules['M_conjunction'][0].compiled_conclusions
+
+        first.rules['T_negation'].append(TableauRule("alpha", [], [], 1))
+        del first.rules['F_negation']
+        assert len(second.rules['T_negation']) == 1 and 'F_negation' in second.rules
+        assert len(OptimizedTableauEngine("wkrq").rules['T_negation']) == 1
+
+    def test_models_from_atomic_formulas(self):
+        """Test that models assign atoms and predicates, not compound formulas"""
+        p = Atom("p")
+        pa, qb = Predicate("P", [Constant("a")]), Predicate("Q", [Constant("b")])
+
+        tableau = classical_signed_tableau(T(Conjunction(pa, Negation(qb))))
+        assert tableau.extract_all_models()[0].assignments == {"P": True, "Q": False}
+
+        tableau = three_valued_signed_tableau(T3(Conjunction(p, Negation(Negation(p)))))
+        assert [dict(model.assignments) for model in tableau.iter_models()] == [{"p": t}]
+
+    def test_models_extracted_once(self):
+        """Test that models are extracted once per build and handed out as copies"""
+        p, q = Atom("p"), Atom("q")
+        tableau = classical_signed_tableau(T(Disjunction(p, q)))
+        models = tableau.extract_all_models()
+        models.clear()
+
+        again = tableau.extract_all_models()
+        assert len(again) == 2 and again is not tableau.extract_all_models()
+        assert all(a is b for a, b in zip(again, tableau.iter_models()))
+
+        tableau.reset([T(Conjunction(p, q))])
+        assert [dict(model.assignments) for model in tableau.extract_all_models()] == [{"p": True, "q": True}]
+
+    def test_alpha_rules_extend_branch_in_place(self):
+        """Test that α-expanded branches stay the children their parent records"""
+        p, q, r = Atom("p"), Atom("q"), Atom("r")
+        tableau = classical_signed_tableau(T(Disjunction(Conjunction(p, q), r)))
+        assert len(tableau.branches) == 2
+
+        root = tableau.branches[0].parent_branch
+        assert all(branch.parent_branch is root for branch in tableau.branches)
+        assert [id(child) for child in root.child_branches] == [id(branch) for branch in tableau.branches]
+        assert T(q) in tableau.branches[0].formula_set
+
+    def test_rule_selection_matches_sorted_choice(self):
+        """Test that the one-pass rule choice is the first after sorting by priority"""
+        from tableaux.tableau_core import OptimizedTableauEngine, TableauBranch
+
+        p, q = Atom("p"), Atom("q")
+        engine = OptimizedTableauEngine("wkrq")
+        candidates = [
+            [T(Disjunction(p, q)), M(Conjunction(p, q)), F(Implication(p, q)), T(Negation(q))],
+            [T(Disjunction(p, q)), N(Conjunction(p, q)), T(Implication(q, p))],
+            [T(p), F(q)],
+        ]
+        for signed_formulas in candidates:
+            branch = TableauBranch(signed_formulas)
+            applicable = engine._find_applicable_rules(branch)
+            applicable.sort(key=lambda x: (x[1].priority, x[1].rule_type))
+            assert engine._select_rule(branch) == (applicable[0] if applicable else None)
+
+    def test_statistics_per_build(self):
+        """Test that building again on one engine reports only the new tableau"""
+        from tableaux.tableau_core import OptimizedTableauEngine
+
+        p, q = Atom("p"), Atom("q")
+        engine = OptimizedTableauEngine("classical")
+        engine.build_tableau([T(p)])
+        assert engine.get_statistics()['fast_path_hit']
+        engine.build_tableau([T(Conjunction(p, Negation(p)))])
+        assert engine.get_statistics()['closed_branches'] == 1
+
+        engine.build_tableau([T(Disjunction(p, q))])
+        fresh = classical_signed_tableau(T(Disjunction(p, q)))
+        stats = engine.get_statistics()
+        assert stats['open_branches'] == 2 and stats['closed_branches'] == 0
+        assert not stats['fast_path_hit']
+        assert stats == fresh.get_statistics()
+
+    def test_rules_edited_after_construction(self):
+        """Test that rules added or replaced on an engine take effect"""
+        from tableaux.tableau_core import OptimizedTableauEngine, TableauRule
+
+        p, q = Atom("p"), Atom("q")
+        engine = OptimizedTableauEngine("classical")
+        engine.build_tableau([T(Negation(p))])
+        assert engine.is_satisfiable()
+
+        # T:¬A read as T:A contradicts F:p once the rule table is edited
+        engine.rules['T_negation'] = [TableauRule("alpha", ["T:¬A"], [["T:A"]], 1, "Custom")]
+        engine.build_tableau([T(Negation(p)), F(p)])
+        assert not engine.is_satisfiable()
+
+        engine.rules['T_negation'] = [TableauRule("beta", ["T:¬A"], [["T:A"], ["F:A"]], 2, "Split")]
+        engine.build_tableau([T(Negation(p)), T(q)])
+        assert len(engine.branches) == 2 and engine.is_satisfiable()
+
+        # Other engines keep the standard rules
+        assert classical_signed_tableau([T(Negation(p)), F(p)]).build()
+
+    def test_reused_engine_releases_earlier_formulas(self):
+        """Test that rebuilding an engine keeps no formulas from earlier tableaux"""
+        import gc
+        import weakref
+
+        p = Atom("p")
+        formula = Conjunction(Atom("long_gone"), Negation(p))
+        tableau = classical_signed_tableau(T(formula))
+        gone = weakref.ref(formula.left)
+        tableau.reset([T(Disjunction(p, Negation(p)))])
+        del formula
+        gc.collect()
+        assert gone() is None
+
+    def test_reset_reuses_engine(self):
+        """Test that a reset engine behaves like a freshly built one"""
+        p, q = Atom("p"), Atom("q")
+        tableau = classical_signed_tableau(T(Conjunction(p, Negation(p))), track_steps=True)
+        rules = tableau.rules
+        assert not tableau.build()
+
+        formula = Disjunction(p, q)
+        tableau.reset([T(formula)])
+        fresh = classical_signed_tableau(T(formula), track_steps=True)
+
+        assert tableau.rules is rules
+        assert tableau.build() and fresh.build()
+        assert tableau.extract_all_models() == fresh.extract_all_models()
+        assert tableau.get_statistics() == fresh.get_statistics()
+        assert len(tableau.construction_steps) == len(fresh.construction_steps)
+
+    def test_statistics_match_branch_counts(self):
+        """Test that get_statistics agrees with the final branch list"""
+        p, q = Atom("p"), Atom("q")
+        formula = Conjunction(Disjunction(p, q), Negation(p))
+        tableau = classical_signed_tableau(T(formula))
+        tableau.build()
+
+        stats = tableau.get_statistics()
+        closed = sum(1 for b in tableau.branches if b.is_closed)
+        assert stats['closed_branches'] == stats['branches_closed'] == closed
+        assert stats['open_branches'] == len(tableau.branches) - closed
+        assert stats['total_branches'] == len(tableau.branches)
+
+        # Callers get a copy of the cached snapshot
+        stats['total_branches'] = -1
+        assert tableau.get_statistics()['total_branches'] == len(tableau.branches)
+
 
 class TestEdgeCasesAndRegressions:
     """Tests for edge cases and regression prevention"""
@@ -617,6 +1108,243 @@ class TestEdgeCasesAndRegressions:
         # Should still work correctly
         assert isinstance(result, bool)
     
+    def test_structural_hash_cached(self):
+        """Test that formula hashes are structural and don't recurse"""
+        p, q = Atom("p"), Atom("q")
+        assert hash(Conjunction(p, Negation(q))) == hash(Conjunction(Atom("p"), Negation(Atom("q"))))
+        assert len({Implication(p, q), Implication(Atom("p"), Atom("q"))}) == 1
+
+        # Far deeper than the recursion limit: hashing must stay O(1)
+        formula = p
+        for _ in range(5000):
+            formula = Negation(formula)
+        assert formula in {formula}
+
+    def test_wkrq_model_evaluation(self):
+        """Test the table-driven wKrQ model connectives"""
+        from tableaux import WkrqModel
+
+        p, q = Atom("p"), Atom("q")
+        negation = {'T': 'F', 'F': 'T', 'M': 'N', 'N': 'M'}
+        for pv in 'TFMN':
+            for qv in 'TFMN':
+                model = WkrqModel({"p": pv, "q": qv})
+                assert model.satisfies(p) == pv
+                assert model.satisfies(Negation(p)) == negation[pv]
+                expected = 'T' if pv == qv == 'T' else 'F' if 'F' in (pv, qv) else 'M'
+                assert model.satisfies(Conjunction(p, q)) == expected
+                assert model.is_satisfying(Negation(Negation(p))) == (pv == 'T')
+
+    def test_model_assignments_read_only_view(self):
+        """Test that assignments is a live read-only view with an explicit copy"""
+        from tableaux.unified_model import ClassicalModel
+
+        model = ClassicalModel({"p": True, "q": False})
+        view = model.assignments
+        assert view == {"p": True, "q": False}
+        with pytest.raises(TypeError):
+            view["p"] = False
+
+        copy = model.copy_assignments()
+        copy["p"] = False
+        assert model.get_assignment("p") == True
+
+        wk3_model = weakKleeneModel({"p": t, "q": e})
+        assert wk3_model.assignments == {"p": t, "q": e}
+        with pytest.raises(TypeError):
+            wk3_model.assignments["q"] = f
+        assert wk3_model.copy_assignments() == {"p": t, "q": e}
+
+    def test_model_string_rendering(self):
+        """Test model text for each logic and that it is built once"""
+        from tableaux.unified_model import ClassicalModel, WkrqModel
+
+        model = ClassicalModel({"q": False, "p": True})
+        assert str(model) == "{p=true, q=false}"
+        assert str(model) is str(model)
+        assert str(weakKleeneModel({"q": e, "p": t})) == "{p=t, q=e}"
+        assert str(WkrqModel({"p": "M"})) == "{p=M}"
+        assert str(ClassicalModel({})) == "{}"
+        assert model == ClassicalModel({"p": True, "q": False})
+
+    def test_classical_model_value_conversion(self):
+        """Test that classical models normalise mixed assignment values"""
+        from tableaux.unified_model import ClassicalModel
+
+        class Boxed:
+            value = 1
+
+        model = ClassicalModel({"a": True, "b": t, "c": f, "d": e, "g": Boxed(), "h": 0})
+        assert model.copy_assignments() == {"a": True, "b": True, "c": False, "d": None,
+                                            "g": True, "h": False}
+
+    def test_models_hashable(self):
+        """Test that equal models hash alike and deduplicate in sets"""
+        from tableaux.unified_model import ClassicalModel, WkrqModel
+
+        a = ClassicalModel({"p": True, "q": False})
+        b = ClassicalModel({"q": False, "p": True})
+        assert a == b and hash(a) == hash(b)
+        assert len({a, b, ClassicalModel({"p": False})}) == 2
+        assert a != WkrqModel({"p": "T", "q": "F"})
+        assert len({weakKleeneModel({"p": e}), weakKleeneModel({"p": "e"})}) == 1
+
+        tableau = classical_signed_tableau(T(Disjunction(Atom("p"), Atom("p"))))
+        assert len(set(tableau.extract_all_models())) == 1
+
+    def test_model_evaluation_deep_formula(self):
+        """Test that model evaluation doesn't recurse on formula depth"""
+        from tableaux.unified_model import ClassicalModel, WkrqModel
+
+        p, q = Atom("p"), Atom("q")
+        formula = p
+        for _ in range(1000):
+            formula = Negation(Negation(Conjunction(formula, q)))
+
+        assert ClassicalModel({"p": True, "q": True}).satisfies(formula) == True
+        assert weakKleeneModel({"p": t, "q": e}).satisfies(formula) == e
+        assert WkrqModel({"p": "T", "q": "T"}).is_satisfying(formula)
+
+    def test_model_evaluation_compiled_once(self):
+        """Test that a formula is compiled once and reused across models"""
+        from tableaux.unified_model import ClassicalModel, _compiled_formula
+
+        p, q = Atom("p"), Atom("q")
+        formula = Implication(Conjunction(p, Negation(q)), Disjunction(q, p))
+        _compiled_formula.cache_clear()
+        for p_val in (True, False):
+            for q_val in (True, False):
+                assert ClassicalModel({"p": p_val, "q": q_val}).satisfies(formula) == True
+        assert _compiled_formula.cache_info().misses == 1
+
+        # Atom names are embedded as literals, never as code
+        odd = Atom("x') or True or ('")
+        assert ClassicalModel({}).satisfies(Conjunction(odd, odd)) == False
+
+    def test_formula_linearization(self):
+        """Test that formulas flatten to shared post-order programs"""
+        from tableaux.unified_model import _linearize
+
+        p, q = Atom("p"), Atom("q")
+        shared = Conjunction(p, q)
+        formula = Disjunction(shared, Negation(shared))
+        program = _linearize(formula)
+        assert [node for node, _ in program] == [p, q, shared, Negation(shared), formula]
+        assert [operands for _, operands in program] == [(), (), (0, 1), (2,), (2, 3)]
+        assert _linearize(Disjunction(shared, Negation(shared))) is program
+
+    def test_model_evaluation_dispatch(self):
+        """Test connective dispatch for subclasses and unsupported formulas"""
+        from tableaux.unified_model import ClassicalModel
+
+        class MarkedNegation(Negation):
+            __slots__ = ()
+
+        p = Atom("p")
+        assert ClassicalModel({"p": True}).satisfies(MarkedNegation(p)) == False
+        assert weakKleeneModel({"p": e}).satisfies(MarkedNegation(p)) == e
+        with pytest.raises(ValueError):
+            ClassicalModel({"p": True}).satisfies(Predicate("P", [Constant("a")]))
+
+    def test_propositional_formulas_use_slots(self):
+        """Test that propositional formula nodes carry no instance __dict__"""
+        import pickle
+
+        p, q = Atom("p"), Atom("q")
+        formulas = [p, Negation(p), Conjunction(p, q), Disjunction(p, q), Implication(p, q)]
+        for formula in formulas:
+            assert not hasattr(formula, '__dict__')
+            assert pickle.loads(pickle.dumps(formula)) == formula
+
+        terms = [Constant("a"), Variable("X"), FunctionApplication("f", [Constant("a")])]
+        for term in terms:
+            assert not hasattr(term, '__dict__')
+            assert pickle.loads(pickle.dumps(term)) == term
+
+    def test_get_atoms_deep_formula(self):
+        """Test atom collection on mixed and very deep formulas"""
+        p, q, r = Atom("p"), Atom("q"), Atom("r")
+        formula = Implication(Conjunction(p, Negation(q)), Disjunction(r, p))
+        assert formula.get_atoms() == {"p", "q", "r"}
+
+        deep = Conjunction(p, q)
+        for i in range(5000):
+            deep = Disjunction(deep, Atom(f"a{i % 3}"))
+        assert deep.get_atoms() == {"p", "q", "a0", "a1", "a2"}
+
+    def test_get_atoms_cached(self):
+        """Test that atom sets are computed once and handed out as copies"""
+        p, q = Atom("p"), Atom("q")
+        formula = Implication(Conjunction(p, Negation(q)), p)
+        atoms = formula.get_atoms()
+        atoms.add("r")
+        assert formula.get_atoms() == {"p", "q"}
+        assert formula.get_atoms() is not formula.get_atoms()
+
+    def test_get_atoms_shared_subformulas(self):
+        """Test that atom collection costs the DAG size, not the tree size"""
+        p, q = Atom("p"), Atom("q")
+        # Depth 60: the unfolded tree has 2^60 leaves
+        formula = Disjunction(p, q)
+        for _ in range(60):
+            formula = Conjunction(formula, Negation(formula))
+        assert formula.get_atoms() == {"p", "q"}
+
+    def test_propositional_formulas_interned(self):
+        """Test that equal propositional formulas are the same instance"""
+        import copy
+        import pickle
+
+        p, q = Atom("p"), Atom("q")
+        formula = Implication(Conjunction(p, Negation(q)), Disjunction(q, p))
+        assert Atom("p") is p
+        assert Implication(Conjunction(Atom("p"), Negation(Atom("q"))), Disjunction(q, p)) is formula
+        assert pickle.loads(pickle.dumps(formula)) is formula
+        assert copy.deepcopy(formula) is formula
+        assert Conjunction(p, q) is not Disjunction(p, q)
+
+        class MarkedNegation(Negation):
+            __slots__ = ()
+        assert MarkedNegation(p) is not Negation(p) and MarkedNegation(p) == Negation(p)
+
+        # An interned hit is not reinitialised with the new, equal operand
+        pa = Predicate("P", [Constant("a")])
+        held = Conjunction(pa, q)
+        assert Conjunction(Predicate("P", [Constant("a")]), q) is held
+        assert held.left is pa
+
+        # Keyword construction interns like positional construction
+        assert Atom(name="p") is p
+        assert Negation(operand=p) is Negation(p)
+        assert Conjunction(p, right=q) is Conjunction(left=p, right=q) is Conjunction(p, q)
+        with pytest.raises(TypeError):
+            Negation(p, operand=p)
+        with pytest.raises(TypeError):
+            Atom(label="p")
+
+        # Operands are matched by identity, so an operand's subclass is kept
+        marked = Negation(MarkedNegation(p))
+        plain = Negation(Negation(p))
+        assert plain is not marked and type(plain.operand) is Negation
+        deep_marked = Negation(Conjunction(MarkedNegation(p), q))
+        assert type(Negation(Conjunction(Negation(p), q)).operand.left) is Negation
+
+        with pytest.raises(ValueError):
+            Atom("")
+        with pytest.raises(ValueError):
+            Negation(["p"])
+
+    def test_formula_components(self):
+        """Test that connectives list their immediate subformulas"""
+        p, q = Atom("p"), Atom("q")
+        loves = Predicate("Loves", [Constant("a")])
+        assert p._components() == () and loves._components() == ()
+        assert Negation(p)._components() == (p,)
+        assert Conjunction(p, q)._components() == (p, q)
+        assert Disjunction(q, p)._components() == (q, p)
+        assert Implication(p, loves)._components() == (p, loves)
+        assert Implication(Negation(p), Disjunction(loves, q)).get_atoms() == {"p", "q", "Loves"}
+
     def test_large_disjunction(self):
         """Test large disjunction"""
         atoms = [Atom(f"p{i}") for i in range(10)]